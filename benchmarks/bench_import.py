@@ -0,0 +1,61 @@
+"""
+Import time benchmark. Each statement is timed in a fresh interpreter and checked against its budget,
+the script exits with an error if any statement is over budget.
+Byte-compile the package first (`python -m compileall libscr`) so compiling is not part of the timings.
+
+Usage: python benchmarks/bench_import.py
+"""
+import sys
+import struct
+import subprocess
+
+REPEAT = 10
+
+# A script declaring a single empty state: the function count and entry, then the start and end of the state.
+MINIMAL_SCRIPT = struct.pack("<I32sII32sI", 1, b"State0", 0, 0, b"State0", 1)
+
+# Import budgets in milliseconds.
+IMPORT_BUDGETS = {
+
+    "import libscr": 5,
+    "from libscr import parse_script": 25,
+}
+
+# The first parse also loads the command map and the generated node decoders.
+FIRST_USE_BUDGETS = {
+
+    "from libscr.commands import get_command_table; get_command_table()": 40,
+    f"from libscr import parse_buffer; parse_buffer({MINIMAL_SCRIPT!r})": 60,
+}
+
+
+def time_statement(statement):
+    """
+    Get the best wall time of running a statement in a fresh interpreter, in milliseconds.
+    """
+    code = f"import time; start = time.perf_counter(); {statement}; print(time.perf_counter() - start)"
+    timings = []
+
+    for _ in range(REPEAT):
+        output = subprocess.check_output([sys.executable, "-c", code])
+        timings.append(float(output) * 1000)
+
+    return min(timings)
+
+
+def main():
+    over_budget = False
+
+    for budgets in (IMPORT_BUDGETS, FIRST_USE_BUDGETS):
+        for statement, budget in budgets.items():
+            elapsed = time_statement(statement)
+            status = "ok" if elapsed <= budget else "OVER BUDGET"
+
+            print(f"{elapsed:7.1f} ms (budget {budget} ms) {status}: {statement}")
+            over_budget |= elapsed > budget
+
+    sys.exit(1 if over_budget else 0)
+
+
+if __name__ == "__main__":
+    main()
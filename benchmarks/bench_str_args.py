@@ -0,0 +1,73 @@
+"""
+Microbenchmark for decoding bytestring command arguments.
+Compares the original set based ASCII check against `libscr.scr.decode_str_arg`.
+
+Usage: python benchmarks/bench_str_args.py
+"""
+import random
+import timeit
+
+from libscr.scr import ASCII_RANGE, STR_ARG_CACHE, bytes_to_str, decode_str_arg
+
+NUM_ARGS = 100000
+NUM_NAMES = 400
+REPEAT = 5
+
+
+def set_based_decode(bytes_value):
+    """
+    The original heuristic: build a set of the bytes and subtract the readable range.
+    """
+    if not set(bytes_value) - ASCII_RANGE:
+        return bytes_to_str(bytes_value)
+
+    return bytes_value
+
+
+def make_args():
+    """
+    Build a list of 32 byte sprite name arguments, with names repeating the way they do
+    in real scripts and a small share of non-text data.
+    """
+    rng = random.Random(0)
+    names = [f"spr{index:03d}_{rng.randrange(100):02d}".encode("ascii").ljust(32, b"\x00")
+             for index in range(NUM_NAMES)]
+
+    args = []
+
+    for _ in range(NUM_ARGS):
+        if rng.random() < 0.05:
+            args.append(bytes(rng.randrange(256) for _ in range(32)))
+
+        else:
+            args.append(rng.choice(names))
+
+    return args
+
+
+def main():
+    args = make_args()
+
+    if [set_based_decode(arg) for arg in args] != [decode_str_arg(arg) for arg in args]:
+        raise AssertionError("Decoded arguments do not match!")
+
+    def run_set_based():
+        for arg in args:
+            set_based_decode(arg)
+
+    def run_cached():
+        STR_ARG_CACHE.clear()
+
+        for arg in args:
+            decode_str_arg(arg)
+
+    set_based = min(timeit.repeat(run_set_based, number=1, repeat=REPEAT))
+    cached = min(timeit.repeat(run_cached, number=1, repeat=REPEAT))
+
+    print(f"set based:      {set_based * 1000:.1f} ms for {NUM_ARGS} args")
+    print(f"decode_str_arg: {cached * 1000:.1f} ms for {NUM_ARGS} args")
+    print(f"speedup:        {set_based / cached:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,46 @@
-from .scr import parse_script
+import importlib
+
+# Public names, and the module each of them lives in. Modules are only imported once one of
+# their names is first used, which keeps `import libscr` cheap for short lived processes.
+_EXPORTS = {
+
+    "ScriptIndex": "scr",
+    "build_index": "scr",
+    "parse_function": "scr",
+    "parse_script": "scr",
+    "parse_buffer": "scr",
+    "iter_commands": "scr",
+    "load_json": "scr",
+    "TokenTable": "table",
+    "build_token_table": "table",
+    "decode_columns": "table",
+    "build_script": "builder",
+    "build_script_from_json": "builder",
+    "ScriptEditor": "builder",
+    "ScriptPatcher": "patch",
+    "open_patcher": "patch",
+    "AstFile": "astfile",
+    "dump_ast": "astfile",
+    "load_ast": "astfile",
+    "open_ast_file": "astfile",
+    "DiskCache": "cache",
+    "ScriptCache": "cache",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,7 +1,13 @@
 import os
+import sys
+import glob
 import argparse
+import concurrent.futures
 
 from .scr import parse_script
+from .cache import DEFAULT_CACHE_SIZE, DiskCache
+from .manifest import ConversionManifest
+from .builder import build_script_from_json
 
 
 def abs_path(value):
@@ -13,19 +19,151 @@ def abs_path(value):
     return value
 
 
+def expand_scr_paths(parser, values):
+    """
+    Expand the script paths given on the command line. Directories are searched for script files
+    and globs are expanded, keeping only the script files they match. Each script is only listed once.
+    """
+    scr_paths = {}
+
+    for value in values:
+        if os.path.isdir(value):
+            matches = glob.glob(os.path.join(glob.escape(value), "**", "*.bin"), recursive=True)
+            matches = filter(os.path.isfile, matches)
+
+        elif glob.has_magic(value):
+            matches = glob.glob(value, recursive=True)
+            matches = [match for match in matches if match.endswith(".bin") and os.path.isfile(match)]
+
+        elif os.path.isfile(value):
+            matches = [value]
+
+        else:
+            parser.error(f"Invalid file path {value}! Does not exist!")
+
+        for match in matches:
+            scr_paths.setdefault(os.path.abspath(match), None)
+
+    return list(scr_paths)
+
+
+def parse_scripts(scr_paths, jobs, use_mmap=False, compact=False, cache=None):
+    """
+    Parse many script files across a pool of processes. The largest scripts are started first so a long
+    script started last does not hold up the whole batch. We return the scripts that failed.
+    """
+    scr_paths = sorted(scr_paths, key=os.path.getsize, reverse=True)
+    failures = []
+
+    if jobs == 1 or len(scr_paths) <= 1:
+        for scr_path in scr_paths:
+            try:
+                parse_script(scr_path, use_mmap=use_mmap, compact=compact, cache=cache)
+
+            except Exception as error:
+                print(f"Failed to parse {scr_path}: {error}", file=sys.stderr)
+                failures.append(scr_path)
+
+        return failures
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {executor.submit(parse_script, scr_path, None, use_mmap, compact, cache): scr_path
+                   for scr_path in scr_paths}
+
+        for future in concurrent.futures.as_completed(futures):
+            error = future.exception()
+
+            if error is not None:
+                print(f"Failed to parse {futures[future]}: {error}", file=sys.stderr)
+                failures.append(futures[future])
+
+    return failures
+
+
+def convert_incremental(parser, scr_dir, jobs, use_mmap=False, compact=False, cache=None):
+    """
+    Convert the scripts in a directory that changed since the last conversion, and remove the JSON
+    documents of scripts that have been removed. We return the scripts that failed.
+    """
+    if not os.path.isdir(scr_dir):
+        parser.error(f"Invalid directory {scr_dir}! Does not exist!")
+
+    manifest = ConversionManifest.load(scr_dir, {"compact": compact})
+    changed, removed = manifest.get_changes(expand_scr_paths(parser, [scr_dir]))
+
+    for rel_path in removed:
+        manifest.remove(rel_path)
+
+    failures = parse_scripts(changed, jobs, use_mmap, compact, cache)
+
+    for scr_path in changed:
+        if scr_path in failures:
+            manifest.discard(scr_path)
+
+        else:
+            manifest.record(scr_path)
+
+    manifest.save()
+
+    return failures
+
+
 def main():
     parser = argparse.ArgumentParser("scr")
     subparsers = parser.add_subparsers(title="commands")
 
     tojson = subparsers.add_parser("tojson")
-    tojson.add_argument(dest="scr_path", type=abs_path, help="Script bin file input path.")
+    tojson.add_argument(dest="scr_paths", nargs="*", help="Script bin file input paths, directories, or globs.")
+    tojson.add_argument("--incremental", dest="incremental_dir",
+                        help="Only convert the scripts in this directory that changed since the last conversion.")
+    tojson.add_argument("--mmap", dest="use_mmap", action="store_true", help="Memory map the script file.")
+    tojson.add_argument("--compact", action="store_true", help="Render nodes as arrays without indentation.")
+    tojson.add_argument("--cache", dest="cache_dir", default=os.environ.get("LIBSCR_CACHE_DIR"),
+                        help="Cache directory for parsed scripts. Defaults to $LIBSCR_CACHE_DIR if it is set.")
+    tojson.add_argument("--cache-size", type=int, default=DEFAULT_CACHE_SIZE // (1024 * 1024),
+                        help="Cache size limit in megabytes.")
+    tojson.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="Number of scripts to parse at once.")
+
+    tobin = subparsers.add_parser("tobin")
+    tobin.add_argument(dest="json_path", type=abs_path, help="Script JSON file input path.")
+    tobin.add_argument("-o", "--output", dest="bin_path", help="Script bin file output path.")
 
     args, _ = parser.parse_known_args()
 
-    scr_path = getattr(args, "scr_path", None)
+    scr_paths = getattr(args, "scr_paths", None)
+    json_path = getattr(args, "json_path", None)
+
+    if scr_paths is not None:
+        if args.jobs < 1:
+            parser.error("The number of jobs must be at least 1!")
+
+        if not scr_paths and args.incremental_dir is None:
+            parser.error("No script paths given!")
+
+        cache = DiskCache(args.cache_dir, args.cache_size * 1024 * 1024) if args.cache_dir else None
+        failures = []
+
+        if scr_paths:
+            scr_paths = expand_scr_paths(parser, scr_paths)
+            failures.extend(parse_scripts(scr_paths, args.jobs, args.use_mmap, args.compact, cache))
+
+        if args.incremental_dir is not None:
+            failures.extend(convert_incremental(parser, args.incremental_dir, args.jobs, args.use_mmap,
+                                                args.compact, cache))
+
+        if failures:
+            sys.exit(1)
+
+    elif json_path is not None:
+        bin_path = args.bin_path
+
+        if bin_path is None:
+            bin_path = os.path.splitext(json_path)[0] + ".bin"
+
+        if os.path.abspath(bin_path) == json_path:
+            parser.error(f"Output path {bin_path} is the same as the input path!")
 
-    if scr_path is not None:
-        parse_script(scr_path)
+        build_script_from_json(json_path, bin_path)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,428 @@
+import sys
+import mmap
+import array
+import struct
+import functools
+import contextlib
+import collections
+
+from .commands import *
+from .const import *
+from .scr import (COMMAND_BODY_END, COMMAND_HAS_BODY, AstNode, LazyScrNode, ScrNode, input_buffer, output_file,
+                  paused_gc, _check_lazy_mmap)
+from .table import _format_fields
+
+AST_FILE_MAGIC = b"SCRA"
+AST_FILE_VERSION = 1
+
+# Magic, format version, reserved (always 0), node count, string count, string data size, argument data size.
+AST_FILE_HEADER_STRUCT = struct.Struct("<4sHHIIII")
+
+# String references with this bit set refer to raw bytestrings rather than decoded strings.
+BYTES_REF_FLAG = 0x80000000
+
+ArgsCodec = collections.namedtuple("ArgsCodec", ("struct", "bytes_fields"))
+
+
+def _padded_size(size):
+    """
+    Helper to round a section size up so the following section stays 4 byte aligned.
+    """
+    return (size + 3) & ~3
+
+
+@functools.lru_cache(maxsize=None)
+def get_args_codec(command_id):
+    """
+    Get the struct used to store the arguments of a command in an AST file. It is the command struct
+    with every bytestring field swapped for a reference into the string table, so arguments are stored
+    the way the parser decoded them and never need to be decoded again.
+    """
+    decoder = get_command_decoder(command_id)
+
+    if not decoder.bytes_fields:
+        return ArgsCodec(decoder.struct, ())
+
+    args_format = "".join("I" if code == "s" else code for code, _ in _format_fields(decoder.struct))
+    return ArgsCodec(struct.Struct(f"<{args_format}"), tuple(index for index, _ in decoder.bytes_fields))
+
+
+def _iter_ast_nodes(nodes, depth=0):
+    """
+    Helper to walk an AST, yielding each node along with its nesting depth the same way as `iter_commands`.
+    """
+    for node in nodes:
+        yield depth, node
+
+        if node.body is not None:
+            yield from _iter_ast_nodes(node.body, depth + 1)
+
+
+class _StringTable:
+    """
+    Helper to intern the strings and bytestrings of an AST file as they are referenced.
+    """
+    def __init__(self):
+        self.refs = {}
+        self.offsets = array.array("I", [0])
+        self.data = bytearray()
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def get_ref(self, value):
+        ref = self.refs.get(value)
+
+        if ref is not None:
+            return ref
+
+        if isinstance(value, str):
+            ref = len(self)
+            self.data.extend(value.encode("utf-8"))
+
+        else:
+            ref = len(self) | BYTES_REF_FLAG
+            self.data.extend(value)
+
+        self.offsets.append(len(self.data))
+        self.refs[value] = ref
+
+        return ref
+
+
+def _pack_ast_file(commands):
+    """
+    Pack the decoded script commands into an AST file. Nodes are stored in script order as flat columns
+    of command ID, subtree end, and argument offset. The subtree end is the index of the first node after
+    the last node in the body of a command, which lets a reader skip whole bodies without decoding them.
+    """
+    strings = _StringTable()
+
+    command_ids = array.array("I")
+    subtree_ends = array.array("I")
+    args_offsets = array.array("I")
+    args_data = bytearray()
+
+    open_bodies = []
+
+    for depth, node in commands:
+        command_id = node.cmd_id
+
+        if command_id in COMMAND_BODY_END:
+            continue
+
+        index = len(command_ids)
+
+        while open_bodies and open_bodies[-1][0] >= depth:
+            subtree_ends[open_bodies.pop()[1]] = index
+
+        args_codec = get_args_codec(command_id)
+        cmd_args = node.cmd_args
+
+        if args_codec.bytes_fields:
+            cmd_args = list(cmd_args)
+
+            for field_index in args_codec.bytes_fields:
+                cmd_args[field_index] = strings.get_ref(cmd_args[field_index])
+
+        command_ids.append(command_id)
+        subtree_ends.append(index + 1)
+        args_offsets.append(len(args_data))
+
+        try:
+            args_data.extend(args_codec.struct.pack(*cmd_args))
+
+        except struct.error as error:
+            raise ValueError(f"Invalid arguments for command {command_id}: {error}")
+
+        if node.body is not None:
+            open_bodies.append((depth, index))
+
+    for _, index in open_bodies:
+        subtree_ends[index] = len(command_ids)
+
+    columns = (strings.offsets, command_ids, subtree_ends, args_offsets)
+
+    if sys.byteorder != "little":
+        for column in columns:
+            column.byteswap()
+
+    header = AST_FILE_HEADER_STRUCT.pack(AST_FILE_MAGIC, AST_FILE_VERSION, 0, len(command_ids), len(strings),
+                                         len(strings.data), len(args_data))
+
+    string_padding = bytes(_padded_size(len(strings.data)) - len(strings.data))
+    return b"".join((header, strings.offsets, strings.data, string_padding, command_ids, subtree_ends,
+                     args_offsets, args_data))
+
+
+def _write_ast_file(ast_data, output):
+    """
+    Helper to write a packed AST file out in one go, if an output is given.
+    """
+    if output is not None:
+        with output_file(output, "wb") as ast_fp:
+            ast_fp.write(ast_data)
+
+    return ast_data
+
+
+def dump_ast(root_node, output=None):
+    """
+    Store an AST in the binary AST file format. The output may be a file path or an `io.BytesIO`,
+    the packed file is also returned.
+    """
+    return _write_ast_file(_pack_ast_file(_iter_ast_nodes(root_node.body)), output)
+
+
+def dump_commands(commands, output=None):
+    """
+    Store the commands yielded by `iter_commands` in the binary AST file format, without building the AST.
+    """
+    return _write_ast_file(_pack_ast_file(commands), output)
+
+
+class CachedScrNode(LazyScrNode):
+    """
+    A node read from an AST file. The node keeps a reference to the AST file and only
+    reads its arguments the first time they are read.
+    """
+    __slots__ = ()
+
+    @property
+    def cmd_args(self):
+        if self._scr_contents is not None:
+            self._cmd_args = self._scr_contents.get_args(self._offset)
+            self._scr_contents = None
+
+        return self._cmd_args
+
+    @cmd_args.setter
+    def cmd_args(self, cmd_args):
+        self._cmd_args = cmd_args
+        self._scr_contents = None
+
+
+class AstFile:
+    """
+    A reader for the binary AST file format. The node columns are read straight out of the file data,
+    so opening an AST file does not decode anything. Nodes are addressed by their index in script order.
+    """
+    def __init__(self, ast_data):
+        if len(ast_data) < AST_FILE_HEADER_STRUCT.size:
+            raise ValueError("AST file is truncated!")
+
+        magic, version, _, num_nodes, num_strings, string_data_size, args_size = \
+            AST_FILE_HEADER_STRUCT.unpack_from(ast_data)
+
+        if magic != AST_FILE_MAGIC:
+            raise ValueError("Not an AST file!")
+
+        if version != AST_FILE_VERSION:
+            raise ValueError(f"Unsupported AST file version {version}!")
+
+        self._view = memoryview(ast_data)
+        self._strings = [None] * num_strings
+
+        offset = AST_FILE_HEADER_STRUCT.size
+        self.string_offsets, offset = self._read_column(offset, num_strings + 1)
+
+        self.string_data_start = offset
+        offset += _padded_size(string_data_size)
+
+        self.command_id, offset = self._read_column(offset, num_nodes)
+        self.subtree_end, offset = self._read_column(offset, num_nodes)
+        self.args_offset, offset = self._read_column(offset, num_nodes)
+
+        self.args_data_start = offset
+
+        if offset + args_size != len(self._view):
+            raise ValueError("AST file size mismatch!")
+
+    def _read_column(self, offset, count):
+        """
+        Helper to get a column of unsigned ints from the file data. On little endian hosts the column
+        is a view of the file data, otherwise it has to be copied and swapped.
+        """
+        end = offset + (count * INT_SIZE)
+
+        if end > len(self._view):
+            raise ValueError("AST file is truncated!")
+
+        if sys.byteorder == "little":
+            column = self._view[offset:end].cast("I")
+
+        else:
+            column = array.array("I", self._view[offset:end])
+            column.byteswap()
+
+        return column, end
+
+    def __len__(self):
+        return len(self.command_id)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.release()
+
+    def release(self):
+        """
+        Release our views of the file data, so a memory mapped file can be closed.
+        """
+        for column in (self.string_offsets, self.command_id, self.subtree_end, self.args_offset):
+            if isinstance(column, memoryview):
+                column.release()
+
+        self._view.release()
+
+    def get_string(self, ref):
+        """
+        Get a string or bytestring from the string table by reference.
+        """
+        index = ref & ~BYTES_REF_FLAG
+        value = self._strings[index] if not ref & BYTES_REF_FLAG else None
+
+        if value is None:
+            start = self.string_data_start + self.string_offsets[index]
+            end = self.string_data_start + self.string_offsets[index + 1]
+            value = self._view[start:end].tobytes()
+
+            if not ref & BYTES_REF_FLAG:
+                value = sys.intern(value.decode("utf-8"))
+                self._strings[index] = value
+
+        return value
+
+    def get_args(self, index):
+        """
+        Get the arguments of a node, in the form the parser decodes them.
+        """
+        args_codec = get_args_codec(self.command_id[index])
+        cmd_args = args_codec.struct.unpack_from(self._view, self.args_data_start + self.args_offset[index])
+
+        if not args_codec.bytes_fields:
+            return cmd_args
+
+        cmd_args = list(cmd_args)
+
+        for field_index in args_codec.bytes_fields:
+            cmd_args[field_index] = self.get_string(cmd_args[field_index])
+
+        return tuple(cmd_args)
+
+    def iter_children(self, index=None):
+        """
+        Iterate the indices of the nodes in the body of a node, or of the nodes at the root if no index is given.
+        """
+        if index is None:
+            child_index, end = 0, len(self)
+
+        else:
+            child_index, end = index + 1, self.subtree_end[index]
+
+        while child_index < end:
+            yield child_index
+            child_index = self.subtree_end[child_index]
+
+    def iter_nodes(self):
+        """
+        Iterate every node in the file along with its nesting depth, the same way as `iter_commands`.
+        The bodies of these nodes are left empty.
+        """
+        command_table = get_command_table()
+        command_ids = self.command_id
+        subtree_ends = self.subtree_end
+
+        end_stack = []
+
+        for index in range(len(self)):
+            while end_stack and end_stack[-1] <= index:
+                end_stack.pop()
+
+            command_id = command_ids[index]
+            has_body = command_id in COMMAND_HAS_BODY
+
+            yield len(end_stack), ScrNode(command_table[command_id].name, command_id, self.get_args(index), has_body)
+
+            if has_body:
+                end_stack.append(subtree_ends[index])
+
+    def get_node(self, index, lazy=False):
+        """
+        Read a node and its body. If `lazy` is set, the node arguments are not read until they are first used.
+        """
+        root_node = AstNode(has_body=True)
+        self._read_nodes(root_node, index, self.subtree_end[index], lazy)
+
+        return root_node.body[0]
+
+    def to_ast(self, lazy=False):
+        """
+        Read every node in the file into an AST.
+        """
+        root_node = AstNode(has_body=True)
+        self._read_nodes(root_node, 0, len(self), lazy)
+
+        return root_node
+
+    def _read_nodes(self, root_node, start, end, lazy):
+        """
+        Helper to read a range of nodes into the body of a root node. Every body is closed
+        once we reach its subtree end.
+        """
+        command_table = get_command_table()
+        command_ids = self.command_id
+        subtree_ends = self.subtree_end
+
+        body_stack = [(end, root_node.body)]
+
+        with paused_gc():
+            for index in range(start, end):
+                while body_stack[-1][0] <= index:
+                    body_stack.pop()
+
+                command_id = command_ids[index]
+                has_body = command_id in COMMAND_HAS_BODY
+
+                if lazy:
+                    node = CachedScrNode(command_table[command_id].name, command_id, self, index, has_body)
+
+                else:
+                    node = ScrNode(command_table[command_id].name, command_id, self.get_args(index), has_body)
+
+                body_stack[-1][1].append(node)
+
+                if has_body:
+                    body_stack.append((subtree_ends[index], node.body))
+
+
+@contextlib.contextmanager
+def open_ast_file(ast_path):
+    """
+    Helper context manager that memory maps an AST file and yields an `AstFile` reader for it.
+    Nodes read lazily must have their arguments read before the file is closed.
+    """
+    with open(ast_path, "rb") as ast_fp:
+        with mmap.mmap(ast_fp.fileno(), 0, access=mmap.ACCESS_READ) as ast_map:
+            with AstFile(ast_map) as ast_file:
+                yield ast_file
+
+
+def load_ast(source, use_mmap=False, lazy=False):
+    """
+    Load an AST from an AST file written by `dump_ast`.
+    The source may be an AST file path or any buffer containing the file data.
+    If `lazy` is set, the node arguments are not read until they are first used.
+    """
+    _check_lazy_mmap(lazy, use_mmap)
+
+    with input_buffer(source, use_mmap) as ast_data:
+        ast_file = AstFile(ast_data)
+
+        try:
+            return ast_file.to_ast(lazy)
+
+        finally:
+            if not lazy:
+                ast_file.release()
@@ -0,0 +1,314 @@
+import base64
+import struct
+
+from .commands import *
+from .commands import COMMAND_ID_STRUCT
+from .const import *
+from .scr import (COMMAND_BODY_CLOSERS, COMMAND_FUNCTIONS, FUNCTION_ENTRY_STRUCT, ScriptIndex, input_buffer,
+                  json_node_fields, output_file, paused_gc, read_json, _parse_function_range, _parse_header)
+
+
+def _flatten_nodes(nodes, commands):
+    """
+    Flatten a list of nodes into the commands that make up the script, following each body with
+    the command that ends it. We return the number of bytes the flattened commands take up.
+    """
+    size = 0
+
+    for node in nodes:
+        command_id = node.cmd_id
+        decoder = get_command_decoder(command_id)
+
+        commands.append((command_id, decoder, _encode_args(command_id, decoder, node.cmd_args)))
+        size += INT_SIZE + decoder.size
+
+        if node.body is not None:
+            size += _flatten_nodes(node.body, commands)
+
+            closer_id = COMMAND_BODY_CLOSERS[command_id]
+            commands.append((closer_id, get_command_decoder(closer_id), ()))
+            size += INT_SIZE
+
+    return size
+
+
+def _flatten_json(json_nodes, commands):
+    """
+    Flatten a list of JSON nodes into the commands that make up the script, the same way as
+    `_flatten_nodes`, without building any intermediate nodes.
+    """
+    size = 0
+
+    for json_node in json_nodes:
+        command_id, cmd_args, json_body = json_node_fields(json_node)
+        decoder = get_command_decoder(command_id)
+
+        commands.append((command_id, decoder, _encode_json_args(command_id, decoder, cmd_args)))
+        size += INT_SIZE + decoder.size
+
+        closer_id = COMMAND_BODY_CLOSERS.get(command_id)
+
+        if closer_id is not None:
+            size += _flatten_json(json_body, commands)
+
+            commands.append((closer_id, get_command_decoder(closer_id), ()))
+            size += INT_SIZE
+
+    return size
+
+
+def _encode_str(command_id, value, size):
+    """
+    Helper to encode a string argument or function name, making sure it fits in its field.
+    """
+    if isinstance(value, str):
+        value = value.encode("ascii")
+
+    if len(value) > size:
+        raise ValueError(f"Argument too long for command {command_id}: {value!r}")
+
+    return value
+
+
+def _encode_args(command_id, decoder, cmd_args):
+    """
+    Helper to encode the string arguments of a command, making sure they fit in their fields.
+    """
+    if not decoder.bytes_fields:
+        return cmd_args
+
+    cmd_args = list(cmd_args)
+
+    for index, size in decoder.bytes_fields:
+        cmd_args[index] = _encode_str(command_id, cmd_args[index], size)
+
+    return cmd_args
+
+
+def _encode_json_args(command_id, decoder, cmd_args):
+    """
+    Helper to encode the string arguments of a command loaded from JSON, in place.
+    Base64 encoded bytestrings are told apart from names the same way as in `args_from_json`.
+    """
+    for index, size in decoder.bytes_fields:
+        arg = cmd_args[index]
+
+        if len(arg) > size:
+            cmd_args[index] = base64.b64decode(arg)
+
+        else:
+            cmd_args[index] = _encode_str(command_id, arg, size)
+
+    return cmd_args
+
+
+def _pack_commands(commands, scr_buffer, offset):
+    """
+    Pack the flattened commands into the script buffer, starting at the given offset.
+    """
+    pack_command_id = COMMAND_ID_STRUCT.pack_into
+
+    for command_id, decoder, cmd_args in commands:
+        pack_command_id(scr_buffer, offset, command_id)
+        offset += INT_SIZE
+
+        try:
+            decoder.struct.pack_into(scr_buffer, offset, *cmd_args)
+
+        except struct.error as error:
+            raise ValueError(f"Invalid arguments for command {command_id}: {error}")
+
+        offset += decoder.size
+
+    return offset
+
+
+def _pack_header(functions, scr_buffer):
+    """
+    Pack the function count and function entries of the script header.
+    We return the offset of the script commands.
+    """
+    struct.pack_into("<I", scr_buffer, 0, len(functions))
+    offset = INT_SIZE
+
+    for function_name, function_offset in functions:
+        function_name = _encode_str(CMD_START_STATE, function_name, FUNCTION_NAME_LEN)
+        FUNCTION_ENTRY_STRUCT.pack_into(scr_buffer, offset, function_name, function_offset)
+        offset += FUNCTION_ENTRY_LEN
+
+    return offset
+
+
+def _build(functions, commands, script_size, output):
+    """
+    Pack the script header and flattened commands into a single buffer, and write it out in one go.
+    """
+    scr_buffer = bytearray(INT_SIZE + (FUNCTION_ENTRY_LEN * len(functions)) + script_size)
+
+    script_start = _pack_header(functions, scr_buffer)
+    _pack_commands(commands, scr_buffer, script_start)
+
+    if output is not None:
+        with output_file(output, "wb") as scr_fp:
+            scr_fp.write(scr_buffer)
+
+    return scr_buffer
+
+
+def build_script(ast, output=None):
+    """
+    Build a BlazBlue script from an AST, the reverse of `parse_script`. Every state and subroutine
+    at the root of the AST gets a function entry in the script header.
+    The size of the script is worked out up front so it can be packed into a single buffer,
+    which is written out in one go. The buffer is also returned.
+    """
+    functions = []
+    commands = []
+    script_size = 0
+
+    for node in ast.body:
+        if node.cmd_id in COMMAND_FUNCTIONS:
+            functions.append((node.cmd_args[0], script_size))
+
+        script_size += _flatten_nodes((node,), commands)
+
+    return _build(functions, commands, script_size, output)
+
+
+def build_script_from_json(json_source, output=None):
+    """
+    Build a BlazBlue script straight from a JSON document rendered by `parse_script`,
+    without loading it into an AST first. The source may be a JSON file path or a file object.
+    The garbage collector is paused while the document is loaded, as it holds no reference cycles.
+    """
+    functions = []
+    commands = []
+    script_size = 0
+
+    with paused_gc():
+        for json_node in read_json(json_source):
+            command_id, cmd_args, _ = json_node_fields(json_node)
+
+            if command_id in COMMAND_FUNCTIONS:
+                functions.append((cmd_args[0], script_size))
+
+            script_size += _flatten_json((json_node,), commands)
+
+        return _build(functions, commands, script_size, output)
+
+
+def _encode_function(function_node):
+    """
+    Helper to encode a single function node into the script data of that function.
+    """
+    commands = []
+    function_size = _flatten_nodes((function_node,), commands)
+
+    function_data = bytearray(function_size)
+    _pack_commands(commands, function_data, 0)
+
+    return function_data
+
+
+class ScriptEditor:
+    """
+    Rebuild a script after editing some of its functions, without re-encoding the rest.
+    Only the functions that were replaced are encoded, and their script data is spliced into
+    the original script data in place of the old. The function offsets in the header are then
+    shifted by the change in size of every function before them.
+    """
+    def __init__(self, scr_contents):
+        self.scr_contents = scr_contents
+        self.functions = _parse_header(scr_contents)
+
+        script_start = INT_SIZE + (FUNCTION_ENTRY_LEN * len(self.functions))
+        self.index = ScriptIndex(self.functions, script_start, len(scr_contents))
+
+        # Encoded script data of the replaced functions, keyed by the start of their original data.
+        self.replaced = {}
+
+    @classmethod
+    def from_file(cls, scr_path):
+        with input_buffer(scr_path) as scr_contents:
+            return cls(scr_contents)
+
+    @property
+    def modified(self):
+        """
+        The names of the functions that have been replaced.
+        """
+        return [function_name for function_name, (start, _) in self.index.functions.items() if start in self.replaced]
+
+    def get_function(self, function_name, lazy=False):
+        """
+        Parse a function of the script, including any changes made to it.
+        """
+        start, end = self.index.get_range(function_name)
+        function_data = self.replaced.get(start)
+
+        if function_data is not None:
+            return _parse_function_range(function_data, function_name, 0, len(function_data), lazy)
+
+        return _parse_function_range(self.scr_contents, function_name, start, end, lazy)
+
+    def set_function(self, function_node):
+        """
+        Replace a function of the script. The function is looked up by the name of the node,
+        which must already be declared in the script header.
+        """
+        if function_node.cmd_id not in COMMAND_FUNCTIONS:
+            raise ValueError(f"Command {function_node.cmd_id} is not a function definition!")
+
+        start, _ = self.index.get_range(function_node.cmd_args[0])
+        self.replaced[start] = _encode_function(function_node)
+
+    def _splice(self, scr_view):
+        """
+        Helper to gather the chunks of the new script data, mapping the start of each function
+        in the original script data to its offset in the new script data.
+        """
+        script_start = self.index.script_start
+        function_starts = sorted({start for start, _ in self.index.functions.values()})
+
+        # There should be no script data before the first function, but keep it if there is.
+        chunks = [scr_view[script_start:function_starts[0] if function_starts else self.index.script_end]]
+        new_offsets = {}
+        new_offset = len(chunks[0])
+
+        for start, end in zip(function_starts, function_starts[1:] + [self.index.script_end]):
+            chunk = self.replaced.get(start)
+
+            if chunk is None:
+                chunk = scr_view[start:end]
+
+            new_offsets[start] = new_offset
+            new_offset += len(chunk)
+            chunks.append(chunk)
+
+        return chunks, new_offsets
+
+    def build(self, output=None):
+        """
+        Build the edited script. Function names are copied from the original header as-is.
+        The buffer is written out in one go if an output is given, and returned.
+        """
+        script_start = self.index.script_start
+
+        with memoryview(self.scr_contents) as scr_view:
+            chunks, new_offsets = self._splice(scr_view)
+
+            scr_buffer = bytearray(scr_view[:script_start])
+            scr_buffer.extend(b"".join(chunks))
+
+            # Release our views of the original script data before the buffer is returned.
+            chunks.clear()
+
+        for func_index, (_, function_offset) in enumerate(self.functions):
+            offset_position = INT_SIZE + (func_index * FUNCTION_ENTRY_LEN) + FUNCTION_NAME_LEN
+            struct.pack_into("<I", scr_buffer, offset_position, new_offsets[script_start + function_offset])
+
+        if output is not None:
+            with output_file(output, "wb") as scr_fp:
+                scr_fp.write(scr_buffer)
+
+        return scr_buffer
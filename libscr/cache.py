@@ -0,0 +1,283 @@
+import os
+import mmap
+import hashlib
+import threading
+import contextlib
+import collections
+
+from .commands import *
+from .const import *
+from .scr import COMMAND_BODY_END, input_buffer, iter_commands, _parse_tokens
+from .astfile import AST_FILE_VERSION, AstFile, dump_commands, _iter_ast_nodes
+
+AST_CACHE_EXT = ".scra"
+DEFAULT_CACHE_SIZE = 1024 * 1024 * 1024
+
+DEFAULT_SCRIPT_CACHE_SIZE = 256 * 1024 * 1024
+
+# Rough number of bytes a parsed node takes up in memory, arguments included.
+NODE_SIZE_ESTIMATE = 160
+
+
+class DiskCache:
+    """
+    An on-disk cache of parsed scripts, stored in the binary AST file format. Entries are keyed by a hash
+    of the script contents, the libscr version, and the command table, so a changed script, a new version
+    of libscr, or a change to how commands are decoded never reads a stale entry. Reading an entry updates
+    its modification time, and once the cache grows past its size limit the entries that were least recently
+    used are removed.
+    Entries are written atomically, so a cache directory may be shared by many processes.
+    """
+    def __init__(self, cache_dir, max_size=DEFAULT_CACHE_SIZE):
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+
+    def get_key(self, scr_contents):
+        """
+        Get the cache key for a script.
+        """
+        key_prefix = f"{LIBSCR_VERSION}:{AST_FILE_VERSION}:{get_command_table_digest()}:"
+
+        key_hash = hashlib.sha256(key_prefix.encode("utf-8"))
+        key_hash.update(scr_contents)
+
+        return key_hash.hexdigest()
+
+    def get_path(self, key):
+        return os.path.join(self.cache_dir, f"{key}{AST_CACHE_EXT}")
+
+    @contextlib.contextmanager
+    def open_entry(self, key):
+        """
+        Helper context manager that memory maps a cache entry and yields an `AstFile` reader for it,
+        or None if there is no usable entry.
+        """
+        cache_path = self.get_path(key)
+
+        try:
+            cache_fp = open(cache_path, "rb")
+
+        except OSError:
+            yield None
+            return
+
+        with cache_fp:
+            try:
+                os.utime(cache_path)
+                ast_map = mmap.mmap(cache_fp.fileno(), 0, access=mmap.ACCESS_READ)
+
+            except (OSError, ValueError):
+                yield None
+                return
+
+            with ast_map:
+                try:
+                    ast_file = AstFile(ast_map)
+
+                except ValueError:
+                    yield None
+                    return
+
+                with ast_file:
+                    yield ast_file
+
+    def store(self, key, ast_data):
+        """
+        Store a packed AST file in the cache, then make sure the cache fits in its size limit.
+        Caching is best effort, the cache directory may not be writable.
+        """
+        cache_path = self.get_path(key)
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+            with open(temp_path, "wb") as cache_fp:
+                cache_fp.write(ast_data)
+
+            os.replace(temp_path, cache_path)
+
+        except OSError:
+            return
+
+        self.evict()
+
+    def evict(self):
+        """
+        Remove the least recently used entries until the cache fits in its size limit.
+        """
+        entries = []
+        cache_size = 0
+
+        try:
+            with os.scandir(self.cache_dir) as dir_entries:
+                for dir_entry in dir_entries:
+                    if not dir_entry.name.endswith(AST_CACHE_EXT):
+                        continue
+
+                    try:
+                        entry_stat = dir_entry.stat()
+
+                    except OSError:
+                        continue
+
+                    entries.append((entry_stat.st_mtime, entry_stat.st_size, dir_entry.path))
+                    cache_size += entry_stat.st_size
+
+        except OSError:
+            return
+
+        entries.sort()
+
+        for _, entry_size, entry_path in entries:
+            if cache_size <= self.max_size:
+                break
+
+            # Another process may have already removed this entry.
+            with contextlib.suppress(OSError):
+                os.remove(entry_path)
+
+            cache_size -= entry_size
+
+    def iter_commands(self, source, use_mmap=False):
+        """
+        Iterate the commands of a BlazBlue script the same way as `iter_commands`, reading them from
+        the cache if the script has been parsed before. Otherwise the script is parsed and cached.
+        """
+        with input_buffer(source, use_mmap) as scr_contents:
+            key = self.get_key(scr_contents)
+
+            with self.open_entry(key) as ast_file:
+                if ast_file is not None:
+                    yield from ast_file.iter_nodes()
+                    return
+
+            ast_data = dump_commands(iter_commands(scr_contents))
+
+        self.store(key, ast_data)
+
+        with AstFile(ast_data) as ast_file:
+            yield from ast_file.iter_nodes()
+
+    def parse(self, source, use_mmap=False):
+        """
+        Parse a BlazBlue script into an AST, reading it from the cache if the script has been parsed before.
+        """
+        with input_buffer(source, use_mmap) as scr_contents:
+            key = self.get_key(scr_contents)
+
+            with self.open_entry(key) as ast_file:
+                if ast_file is not None:
+                    return ast_file.to_ast()
+
+            ast_data = dump_commands(iter_commands(scr_contents))
+
+        self.store(key, ast_data)
+
+        with AstFile(ast_data) as ast_file:
+            return ast_file.to_ast()
+
+
+class ScriptCache:
+    """
+    An in-process cache of parsed scripts, for long running processes that parse the same scripts
+    over and over. Script files are keyed by their path, modification time and size, and buffers are
+    keyed by a hash of their contents. The size of each AST is estimated from its number of nodes,
+    and once the cache grows past its size limit the least recently used ASTs are dropped.
+    The cache may be shared between threads. Cached ASTs are shared by every caller, so they must
+    not be modified.
+    """
+    def __init__(self, max_size=DEFAULT_SCRIPT_CACHE_SIZE):
+        self.max_size = max_size
+        self.size = 0
+
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_key(self, source):
+        """
+        Get the cache key for a script file path or a buffer containing the script data.
+        """
+        if isinstance(source, (str, os.PathLike)):
+            scr_path = os.path.abspath(source)
+            scr_stat = os.stat(scr_path)
+
+            return scr_path, scr_stat.st_mtime_ns, scr_stat.st_size
+
+        return hashlib.sha256(source).hexdigest()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def _get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry[0]
+
+        return None
+
+    def _put(self, key, root_node, num_nodes):
+        """
+        Helper to add an AST to the cache, dropping the least recently used ASTs until the cache fits.
+        ASTs too large to ever fit are not cached.
+        """
+        entry_size = num_nodes * NODE_SIZE_ESTIMATE
+
+        if entry_size > self.max_size:
+            return
+
+        with self._lock:
+            old_entry = self._entries.pop(key, None)
+
+            if old_entry is not None:
+                self.size -= old_entry[1]
+
+            self._entries[key] = (root_node, entry_size)
+            self.size += entry_size
+
+            while self.size > self.max_size:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.size -= evicted_size
+
+    def parse(self, source, use_mmap=False):
+        """
+        Parse a BlazBlue script into an AST, or get the AST from the cache if the script has been parsed before.
+        The source may be a script file path or any buffer containing the script data.
+        Scripts are parsed outside of the lock, so two threads may both parse a script that is not cached yet.
+        """
+        key = self.get_key(source)
+        root_node = self._get(key)
+
+        if root_node is not None:
+            return root_node
+
+        num_nodes = 0
+
+        def count_nodes(commands):
+            nonlocal num_nodes
+
+            for depth, node in commands:
+                if node.cmd_id not in COMMAND_BODY_END:
+                    num_nodes += 1
+
+                yield depth, node
+
+        root_node = _parse_tokens(count_nodes(iter_commands(source, use_mmap)))
+        self._put(key, root_node, num_nodes)
+
+        return root_node
+
+    def iter_commands(self, source, use_mmap=False):
+        """
+        Iterate the commands of a cached AST the same way as `iter_commands`, parsing the script if it
+        is not cached yet. Unlike `iter_commands`, the bodies of these nodes are filled in.
+        """
+        yield from _iter_ast_nodes(self.parse(source, use_mmap).body)
@@ -0,0 +1,155 @@
+import os
+import sys
+import marshal
+import hashlib
+import contextlib
+
+from .commands import *
+
+DECODER_FACTORY_NAME = "build_decoders"
+
+# Bump this whenever the generated source changes, as it is part of the key of every cached decoder.
+DECODER_GENERATOR_VERSION = 1
+
+
+def _generate_decoder(command_id, decoder, has_body):
+    """
+    Generate the source of a decoder function for a single command. The function unpacks the command
+    arguments and builds the node in one go, so no per command information is looked up at parse time.
+    """
+    lines = [f"    def decode_{command_id}(scr_contents, offset):"]
+    node_args = f"{decoder.name!r}, {command_id}"
+
+    num_args = len(decoder.struct.unpack(bytes(decoder.size)))
+
+    if num_args == 0:
+        lines.append(f"        return ScrNode({node_args}, (), {has_body})")
+
+    elif not decoder.name_fields and not decoder.string_fields:
+        lines.append(f"        return ScrNode({node_args}, unpack_{command_id}(scr_contents, offset), {has_body})")
+
+    else:
+        arg_names = [f"a{index}" for index in range(num_args)]
+        cmd_args = list(arg_names)
+
+        for index in decoder.name_fields:
+            cmd_args[index] = f"decode_name_arg({arg_names[index]})"
+
+        for index in decoder.string_fields:
+            cmd_args[index] = f"decode_str_arg({arg_names[index]})"
+
+        lines.append(f"        {', '.join(arg_names)}, = unpack_{command_id}(scr_contents, offset)")
+        lines.append(f"        return ScrNode({node_args}, ({', '.join(cmd_args)},), {has_body})")
+
+    return lines
+
+
+def generate_decoders_source(body_commands):
+    """
+    Generate the source of a factory function that builds a decoder function for every command
+    in the command map. The decoders are closures over their struct and helper functions.
+    """
+    command_table = get_command_table()
+    lines = [f"def {DECODER_FACTORY_NAME}(ScrNode, decode_name_arg, decode_str_arg):"]
+
+    for command_id, decoder in enumerate(command_table):
+        if decoder is not None and decoder.size > 0:
+            lines.append(f"    unpack_{command_id} = CMD_TABLE[{command_id}].struct.unpack_from")
+
+    lines.append(f"    decoders = [None] * {len(command_table)}")
+
+    for command_id, decoder in enumerate(command_table):
+        if decoder is not None:
+            lines.extend(_generate_decoder(command_id, decoder, command_id in body_commands))
+            lines.append(f"    decoders[{command_id}] = decode_{command_id}")
+
+    lines.append("    return decoders")
+    lines.append("")
+
+    return "\n".join(lines)
+
+
+def get_decoder_cache_dir():
+    """
+    Get the directory the compiled decoders are cached in. This is the user cache directory rather than
+    the package directory, which is often not writable and may be shared by every user of the system.
+    """
+    user_cache_dir = os.environ.get("XDG_CACHE_HOME") or os.environ.get("LOCALAPPDATA")
+
+    if not user_cache_dir:
+        user_cache_dir = os.path.join(os.path.expanduser("~"), ".cache")
+
+    return os.path.join(user_cache_dir, "libscr")
+
+
+def _get_decoder_cache_name(body_commands):
+    """
+    Helper to get the cache file name of the compiled decoders. The generated source is fully determined
+    by the command table, the commands with a body, and the generator itself, so we hash those rather
+    than generating the source just to find out whether it is cached.
+    """
+    key_hash = hashlib.sha256(get_command_table_digest().encode("utf-8"))
+    key_hash.update(repr((DECODER_GENERATOR_VERSION, sorted(body_commands))).encode("utf-8"))
+
+    return f"decoders-{key_hash.hexdigest()[:16]}.{sys.implementation.cache_tag}.marshal"
+
+
+def _load_decoders(cache_name):
+    """
+    Helper to load the compiled decoders from the cache directory, if they are cached.
+    """
+    try:
+        with open(os.path.join(get_decoder_cache_dir(), cache_name), "rb") as cache_fp:
+            return marshal.load(cache_fp)
+
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+
+def _store_decoders(cache_name, code):
+    """
+    Helper to cache the compiled decoders in the cache directory.
+    Caching is best effort, the cache directory may not be writable.
+    """
+    cache_dir = get_decoder_cache_dir()
+    cache_path = os.path.join(cache_dir, cache_name)
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+
+        with open(temp_path, "wb") as cache_fp:
+            marshal.dump(code, cache_fp)
+
+        os.replace(temp_path, cache_path)
+
+    except OSError:
+        with contextlib.suppress(OSError):
+            os.remove(temp_path)
+
+
+def _compile_decoders(body_commands):
+    """
+    Compile the generated decoder source. The code object is cached on disk, so we only pay for
+    generating and compiling it when the command map changes.
+    """
+    cache_name = _get_decoder_cache_name(body_commands)
+    code = _load_decoders(cache_name)
+
+    if code is None:
+        code = compile(generate_decoders_source(body_commands), f"<libscr {cache_name}>", "exec")
+        _store_decoders(cache_name, code)
+
+    return code
+
+
+def build_node_decoders(node_type, decode_name_arg, decode_str_arg, body_commands):
+    """
+    Build a list, indexed by command ID, of generated functions that decode a command into a node.
+    """
+    code = _compile_decoders(body_commands)
+
+    namespace = {"CMD_TABLE": get_command_table()}
+    exec(code, namespace)
+
+    return namespace[DECODER_FACTORY_NAME](node_type, decode_name_arg, decode_str_arg)
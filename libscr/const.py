@@ -1,14 +1,42 @@
 __all__ = [
 
+    "LIBSCR_VERSION",
     "INT_SIZE",
     "FUNCTION_ENTRY_LEN",
     "FUNCTION_NAME_LEN",
     "FUNCTION_DEF_LEN",
     "CHAR_PREFIX_LEN",
+
+    # Special move input constants
+    "MOTION_6",
+    "MOTION_236",
+    "MOTION_623",
+    "MOTION_214",
+    "MOTION_41236",
+    "MOTION_63214",
+    "MOTION_22",
+    "MOTION_2HOLD8",
+    "MOTION_236236",
+    "MOTION_214214",
+    "MOTION_632146",
+    "SPECIAL_RELEASE_A",
+    "SPECIAL_PRESS_A",
+    "SPECIAL_RELEASE_B",
+    "SPECIAL_PRESS_B",
+    "SPECIAL_RELEASE_C",
+    "SPECIAL_PRESS_C",
+    "SPECIAL_RELEASE_D",
+    "SPECIAL_PRESS_D",
+    "MOVE_TYPE_SPECIAL",
+    "MOVE_TYPE_DISTORTION",
+    "MOVE_TYPE_ASTRAL",
 ]
 
 import struct
 
+# Keep this in sync with setup.py, it is part of the key of every cached parse.
+LIBSCR_VERSION = "0.0.1"
+
 INT_SIZE = struct.calcsize("I")
 
 FUNCTION_ENTRY_LEN = 36
@@ -16,3 +44,28 @@ FUNCTION_NAME_LEN = 32
 FUNCTION_DEF_LEN = 34
 
 CHAR_PREFIX_LEN = 16
+
+MOTION_6 = 120
+MOTION_236 = 172
+MOTION_623 = 173
+MOTION_214 = 174
+MOTION_41236 = 175
+MOTION_63214 = 177
+MOTION_22 = 186
+MOTION_2HOLD8 = 189
+MOTION_236236 = 178
+MOTION_214214 = 179
+MOTION_632146 = 249
+
+SPECIAL_RELEASE_A = 3
+SPECIAL_PRESS_A = 4
+SPECIAL_RELEASE_B = 12
+SPECIAL_PRESS_B = 13
+SPECIAL_RELEASE_C = 21
+SPECIAL_PRESS_C = 22
+SPECIAL_RELEASE_D = 30
+SPECIAL_PRESS_D = 31
+
+MOVE_TYPE_SPECIAL = 2
+MOVE_TYPE_DISTORTION = 1542
+MOVE_TYPE_ASTRAL = 1543
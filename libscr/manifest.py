@@ -0,0 +1,153 @@
+import os
+import json
+import hashlib
+
+from .const import *
+from .scr import get_json_path
+
+MANIFEST_NAME = ".libscr-manifest.json"
+MANIFEST_VERSION = 1
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def hash_file(file_path):
+    """
+    Helper to get the SHA-256 hash of a file, without reading the whole file into memory.
+    """
+    file_hash = hashlib.sha256()
+
+    with open(file_path, "rb") as file_fp:
+        for chunk in iter(lambda: file_fp.read(HASH_CHUNK_SIZE), b""):
+            file_hash.update(chunk)
+
+    return file_hash.hexdigest()
+
+
+class ConversionManifest:
+    """
+    A record of the scripts in a directory that have been converted to JSON, kept in the directory itself.
+    For each script we keep its size, modification time and content hash, along with the path of its JSON
+    document. A script is only hashed again if its size or modification time changed, and only converted
+    again if its hash changed or its JSON document is missing. Converting with different options or
+    a different version of libscr starts over.
+    """
+    def __init__(self, scr_dir, options):
+        self.scr_dir = os.path.abspath(scr_dir)
+        self.manifest_path = os.path.join(self.scr_dir, MANIFEST_NAME)
+
+        self.options = dict(options, libscr_version=LIBSCR_VERSION)
+        self.entries = {}
+
+        # Hashes of the changed scripts, which are only recorded once they are converted.
+        self._pending = {}
+
+    @classmethod
+    def load(cls, scr_dir, options):
+        manifest = cls(scr_dir, options)
+
+        try:
+            with open(manifest.manifest_path, "r") as manifest_fp:
+                manifest_data = json.load(manifest_fp)
+
+        except (OSError, ValueError):
+            return manifest
+
+        if manifest_data.get("version") == MANIFEST_VERSION and manifest_data.get("options") == manifest.options:
+            manifest.entries = manifest_data["entries"]
+
+        return manifest
+
+    def _is_unchanged(self, scr_path, rel_path):
+        """
+        Helper to determine if a script is the same as when it was last converted.
+        """
+        entry = self.entries.get(rel_path)
+        scr_stat = os.stat(scr_path)
+
+        if entry is None or not os.path.exists(os.path.join(self.scr_dir, entry["output"])):
+            scr_hash = None
+
+        elif entry["size"] == scr_stat.st_size and entry["mtime_ns"] == scr_stat.st_mtime_ns:
+            return True
+
+        else:
+            scr_hash = hash_file(scr_path)
+
+            if scr_hash == entry["hash"]:
+                entry["mtime_ns"] = scr_stat.st_mtime_ns
+                return True
+
+        self._pending[rel_path] = (scr_stat, scr_hash)
+        return False
+
+    def get_changes(self, scr_paths):
+        """
+        Compare the scripts in the directory against the manifest. We return the scripts that need to be
+        converted, and the manifest entries of the scripts that have been removed.
+        """
+        changed = []
+        rel_paths = set()
+
+        for scr_path in scr_paths:
+            rel_path = os.path.relpath(scr_path, self.scr_dir)
+            rel_paths.add(rel_path)
+
+            if not self._is_unchanged(scr_path, rel_path):
+                changed.append(scr_path)
+
+        removed = [rel_path for rel_path in self.entries if rel_path not in rel_paths]
+
+        return changed, removed
+
+    def remove(self, rel_path):
+        """
+        Remove a script that no longer exists from the manifest, along with its JSON document.
+        """
+        entry = self.entries.pop(rel_path)
+
+        try:
+            os.remove(os.path.join(self.scr_dir, entry["output"]))
+
+        except FileNotFoundError:
+            pass
+
+    def record(self, scr_path):
+        """
+        Record that a changed script has been converted.
+        """
+        rel_path = os.path.relpath(scr_path, self.scr_dir)
+        scr_stat, scr_hash = self._pending.pop(rel_path)
+
+        if scr_hash is None:
+            scr_hash = hash_file(scr_path)
+
+        self.entries[rel_path] = {
+
+            "size": scr_stat.st_size,
+            "mtime_ns": scr_stat.st_mtime_ns,
+            "hash": scr_hash,
+            "output": os.path.relpath(get_json_path(scr_path), self.scr_dir),
+        }
+
+    def discard(self, scr_path):
+        """
+        Forget a changed script that failed to convert, so it is converted again on the next run
+        even if it is reverted to the version in the manifest.
+        """
+        rel_path = os.path.relpath(scr_path, self.scr_dir)
+
+        self.entries.pop(rel_path, None)
+        self._pending.pop(rel_path, None)
+
+    def save(self):
+        """
+        Write the manifest out atomically, so an interrupted run never leaves a broken manifest behind.
+        """
+        manifest_data = {"version": MANIFEST_VERSION, "options": self.options, "entries": self.entries}
+        temp_path = f"{self.manifest_path}.{os.getpid()}.tmp"
+
+        with open(temp_path, "w") as manifest_fp:
+            json.dump(manifest_data, manifest_fp, indent=4, sort_keys=True)
+
+        os.replace(temp_path, self.manifest_path)
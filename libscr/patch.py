@@ -0,0 +1,89 @@
+import mmap
+import struct
+import contextlib
+
+from .commands import *
+from .scr import _unpack_command_args
+from .table import build_token_table
+from .builder import _encode_args
+
+
+class ScriptPatcher:
+    """
+    Edit the arguments of commands in place. Every command has a fixed size, so any argument
+    can be overwritten with `struct.pack_into` at the token offset kept in a `TokenTable`,
+    without parsing the rest of the script or serializing it again.
+    Tokens are addressed by their index in the token table.
+    """
+    def __init__(self, scr_buffer, table=None):
+        if table is None:
+            table = build_token_table(scr_buffer)
+
+        self.scr_buffer = scr_buffer
+        self.table = table
+
+    def __len__(self):
+        return len(self.table)
+
+    def find(self, command_id):
+        """
+        Get the indices of every token with the given command ID.
+        """
+        return self.table.find(command_id)
+
+    def _get_decoder(self, index, command_id=None):
+        """
+        Helper to get the decoder of a token, optionally making sure it is the command we expect.
+        """
+        token_command_id = self.table.command_id[index]
+
+        if command_id is not None and token_command_id != command_id:
+            raise ValueError(f"Token {index} is command {token_command_id}, not {command_id}!")
+
+        return get_command_decoder(token_command_id)
+
+    def get_args(self, index):
+        """
+        Get the decoded arguments of a token, the same way the parser decodes them.
+        """
+        decoder = self._get_decoder(index)
+        return _unpack_command_args(decoder, self.scr_buffer, self.table.offset[index])
+
+    def set_args(self, index, cmd_args, command_id=None):
+        """
+        Overwrite every argument of a token. String arguments must fit in their field.
+        """
+        token_command_id = self.table.command_id[index]
+        decoder = self._get_decoder(index, command_id)
+
+        cmd_args = _encode_args(token_command_id, decoder, cmd_args)
+
+        try:
+            decoder.struct.pack_into(self.scr_buffer, self.table.offset[index], *cmd_args)
+
+        except struct.error as error:
+            raise ValueError(f"Invalid arguments for command {token_command_id}: {error}")
+
+    def set_arg(self, index, arg_index, value, command_id=None):
+        """
+        Overwrite a single argument of a token, leaving the raw bytes of the others untouched.
+        """
+        decoder = self._get_decoder(index, command_id)
+
+        cmd_args = list(decoder.struct.unpack_from(self.scr_buffer, self.table.offset[index]))
+        cmd_args[arg_index] = value
+
+        self.set_args(index, cmd_args)
+
+
+@contextlib.contextmanager
+def open_patcher(scr_path, table=None):
+    """
+    Helper context manager that memory maps a script file for writing and yields a `ScriptPatcher`
+    for it. Changes are flushed to the file on exit. A `TokenTable` kept from an earlier parse of
+    the same file may be passed in to skip tokenizing it again.
+    """
+    with open(scr_path, "r+b") as scr_fp:
+        with mmap.mmap(scr_fp.fileno(), 0, access=mmap.ACCESS_WRITE) as scr_map:
+            yield ScriptPatcher(scr_map, table)
+            scr_map.flush()
@@ -1,15 +1,29 @@
+import gc
 import io
+import os
+import sys
+import mmap
 import json
+import bisect
 import base64
 import struct
+import functools
 import contextlib
 import collections
 
-from .symbols import *
 from .commands import *
 from .const import *
 
 ASCII_RANGE = frozenset(list(range(20, 127)) + [0])
+ASCII_BYTES = bytes(sorted(ASCII_RANGE))
+
+# Decoded string arguments keyed by their raw bytes. Sprite and function names repeat heavily.
+# Declared names and undeclared bytestrings are decoded differently, so they are cached separately.
+NAME_ARG_CACHE = {}
+STR_ARG_CACHE = {}
+STR_ARG_CACHE_SIZE = 65536
+
+encode_json_str = json.encoder.encode_basestring_ascii
 
 SLOT_TYPE_ID = 2
 MATCH_INIT_SUBROUTINE = "MatchInit"
@@ -106,32 +120,166 @@ UPON = {
 
 COMMAND_HAS_BODY = (CMD_START_STATE, CMD_START_SUBROUTINE, CMD_IF, CMD_IF_NOT, CMD_ELSE, CMD_UPON)
 COMMAND_BODY_END = (CMD_END_STATE, CMD_END_IF, CMD_END_SUBROUTINE, CMD_END_IF_NOT, CMD_END_ELSE, CMD_END_UPON)
+COMMAND_BODY_CLOSERS = {
+
+    CMD_START_STATE: CMD_END_STATE,
+    CMD_START_SUBROUTINE: CMD_END_SUBROUTINE,
+    CMD_IF: CMD_END_IF,
+    CMD_IF_NOT: CMD_END_IF_NOT,
+    CMD_ELSE: CMD_END_ELSE,
+    CMD_UPON: CMD_END_UPON,
+}
+
+COMMAND_FUNCTIONS = (CMD_START_STATE, CMD_START_SUBROUTINE)
+
+FUNCTION_ENTRY_STRUCT = struct.Struct(f"<{FUNCTION_NAME_LEN}sI")
+
+
+class ScriptIndex:
+    """
+    An index of the functions declared in the script header. Each function name is mapped to the
+    range of script data holding its commands, which lets us decode a single function without
+    decoding the rest of the script. Building the index does not decode any commands.
+    Names that are kept as bytestrings because of garbage after their NULL character may also
+    be looked up by the text before it.
+    """
+    def __init__(self, functions, script_start, script_end):
+        self.script_start = script_start
+        self.script_end = script_end
+        self.functions = {}
+        self.aliases = {}
+
+        # A function runs until the next function in the script, or until the end of the script.
+        function_starts = sorted({script_start + function_offset for _, function_offset in functions})
+        function_starts.append(script_end)
+
+        for function_name, function_offset in functions:
+            start = script_start + function_offset
+
+            if start >= script_end:
+                raise ValueError(f"Function {function_name} offset out of range!")
+
+            end = function_starts[bisect.bisect_right(function_starts, start)]
+            self.functions[function_name] = (start, end)
+
+            if isinstance(function_name, bytes):
+                alias = _decode_padded_str(function_name.partition(b"\x00")[0])
+                self.aliases.setdefault(alias, function_name)
+
+    @classmethod
+    def from_buffer(cls, scr_contents):
+        functions = _parse_header(scr_contents)
+        script_start = INT_SIZE + (FUNCTION_ENTRY_LEN * len(functions))
+
+        return cls(functions, script_start, len(scr_contents))
+
+    def __contains__(self, function_name):
+        return function_name in self.functions or function_name in self.aliases
+
+    def __iter__(self):
+        return iter(self.functions)
+
+    def __len__(self):
+        return len(self.functions)
+
+    def get_range(self, function_name):
+        """
+        Get the start and end offsets of the script data for a function by name.
+        """
+        function_name = self.aliases.get(function_name, function_name)
+
+        try:
+            return self.functions[function_name]
+
+        except KeyError:
+            raise RuntimeError(f"Unknown function: {function_name}")
 
 
 class AstNode:
+    __slots__ = ("body",)
+
     def __init__(self, has_body=False):
         self.body = [] if has_body else None
 
-    def to_json(self):
-        return [node.to_json() for node in self.body]
+    def to_json(self, compact=False):
+        return [node.to_json(compact) for node in self.body]
+
+    @classmethod
+    def from_json(cls, json_nodes):
+        root_node = cls(has_body=True)
+        root_node.body.extend(ScrNode.from_json(json_node) for json_node in json_nodes)
+
+        return root_node
 
 
 class ScrNode(AstNode):
+    __slots__ = ("cmd_name", "cmd_id", "cmd_args")
+
     def __init__(self, cmd_name, cmd_id, cmd_args, has_body=False):
         AstNode.__init__(self, has_body)
         self.cmd_name = cmd_name
         self.cmd_args = cmd_args
         self.cmd_id = cmd_id
 
-    def to_json(self):
+    def to_json(self, compact=False):
         cmd_args = list(self.cmd_args)
 
         for index, arg in enumerate(cmd_args):
             if isinstance(arg, bytes):
                 cmd_args[index] = base64.b64encode(arg).decode("UTF-8")
 
+        if compact:
+            if self.body is None:
+                return [self.cmd_id, cmd_args]
+
+            return [self.cmd_id, cmd_args, [node.to_json(compact) for node in self.body]]
+
+        body = [node.to_json() for node in self.body] if self.body is not None else []
+
         return {"cmd_name": self.cmd_name, "cmd_id": self.cmd_id,
-                "cmd_args": cmd_args, "body": [node.to_json() for node in self.body]}
+                "cmd_args": cmd_args, "body": body}
+
+    @classmethod
+    def from_json(cls, json_node):
+        command_id, cmd_args, json_body = json_node_fields(json_node)
+        decoder = get_command_decoder(command_id)
+
+        cmd_args = args_from_json(decoder, cmd_args)
+        node = cls(decoder.name, command_id, cmd_args, command_id in COMMAND_HAS_BODY)
+
+        if node.body is not None:
+            node.body.extend(cls.from_json(child_node) for child_node in json_body)
+
+        return node
+
+
+class LazyScrNode(ScrNode):
+    """
+    A script node that keeps a reference to the script data and only decodes
+    its arguments the first time they are read.
+    """
+    __slots__ = ("_scr_contents", "_offset", "_cmd_args")
+
+    def __init__(self, cmd_name, cmd_id, scr_contents, offset, has_body=False):
+        AstNode.__init__(self, has_body)
+        self.cmd_name = cmd_name
+        self.cmd_id = cmd_id
+        self._scr_contents = scr_contents
+        self._offset = offset
+
+    @property
+    def cmd_args(self):
+        if self._scr_contents is not None:
+            decoder = get_command_table()[self.cmd_id]
+            self._cmd_args = _unpack_command_args(decoder, self._scr_contents, self._offset)
+            self._scr_contents = None
+
+        return self._cmd_args
+
+    @cmd_args.setter
+    def cmd_args(self, cmd_args):
+        self._cmd_args = cmd_args
+        self._scr_contents = None
 
 
 def get_normal_input_str(move_value):
@@ -161,9 +309,9 @@ def get_special_input_str(motion_value, button_value):
 def is_ascii_str(bytes_value):
     """
     Helper to determine if a bytestring contains human readable text.
+    Deleting every readable byte leaves nothing behind if there is no other data.
     """
-    non_ascii_bytes = set(bytes_value) - ASCII_RANGE
-    return not non_ascii_bytes
+    return not bytes_value.translate(None, ASCII_BYTES)
 
 
 def bytes_to_str(bytes_value):
@@ -173,15 +321,150 @@ def bytes_to_str(bytes_value):
     return bytes_value.strip(b"\x00").decode("ascii")
 
 
+def _decode_padded_str(bytes_value):
+    """
+    Helper to decode a NULL padded bytestring. Only NULL padding may follow the first NULL character,
+    otherwise the bytestring is returned as-is so that building the script again gives back the same bytes.
+    """
+    str_value, _, padding = bytes_value.partition(b"\x00")
+
+    if padding.strip(b"\x00"):
+        return bytes_value
+
+    try:
+        return str_value.decode("ascii")
+
+    except UnicodeDecodeError:
+        return bytes_value
+
+
+def _cache_str_arg(arg_cache, bytes_value, str_value):
+    """
+    Helper to intern a decoded string argument and cache it by its raw bytes.
+    """
+    if len(arg_cache) >= STR_ARG_CACHE_SIZE:
+        arg_cache.clear()
+
+    str_value = sys.intern(str_value)
+    arg_cache[bytes_value] = str_value
+
+    return str_value
+
+
+def decode_name_arg(bytes_value):
+    """
+    Helper to decode a bytestring argument that is declared to be a name. A name that is not ASCII,
+    or that has anything but NULL padding after it, is returned as-is.
+    Decoded names are interned and cached by their raw bytes, as the same names appear over and over.
+    """
+    str_value = NAME_ARG_CACHE.get(bytes_value)
+
+    if str_value is not None:
+        return str_value
+
+    str_value = _decode_padded_str(bytes_value)
+
+    if isinstance(str_value, bytes):
+        return bytes_value
+
+    return _cache_str_arg(NAME_ARG_CACHE, bytes_value, str_value)
+
+
+def decode_str_arg(bytes_value):
+    """
+    Helper to decode a bytestring argument if it contains human readable text followed by nothing but
+    NULL padding, otherwise it is returned as-is. Decoded strings are interned and cached by their raw bytes,
+    as the same names appear over and over.
+    Only bytestrings that passed the readable text check are ever cached.
+    """
+    str_value = STR_ARG_CACHE.get(bytes_value)
+
+    if str_value is not None:
+        return str_value
+
+    if not is_ascii_str(bytes_value):
+        return bytes_value
+
+    str_value = _decode_padded_str(bytes_value)
+
+    if isinstance(str_value, bytes):
+        return bytes_value
+
+    return _cache_str_arg(STR_ARG_CACHE, bytes_value, str_value)
+
+
+@contextlib.contextmanager
+def paused_gc():
+    """
+    Helper context manager that pauses the cyclic garbage collector. Loading a script allocates
+    a very large number of objects without any reference cycles, which the collector would
+    otherwise scan over and over again.
+    """
+    gc_enabled = gc.isenabled()
+    gc.disable()
+
+    try:
+        yield
+
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def json_node_fields(json_node):
+    """
+    Helper to get the command ID, arguments, and body of a JSON node in either form `parse_script`
+    renders. Compact nodes are `[cmd_id, cmd_args]` arrays, with a body array appended for commands
+    that have a body. Command names are left out of compact nodes, they are looked up on load.
+    """
+    if isinstance(json_node, list):
+        return json_node[0], json_node[1], json_node[2] if len(json_node) > 2 else ()
+
+    return json_node["cmd_id"], json_node["cmd_args"], json_node["body"]
+
+
+def args_from_json(decoder, cmd_args):
+    """
+    Helper to convert command arguments loaded from JSON back to the form the parser produces.
+    Bytestrings are base64 encoded in JSON, which always makes them longer than their field,
+    while strings decoded from a bytestring always fit in their field.
+    """
+    if not decoder.bytes_fields:
+        return tuple(cmd_args)
+
+    cmd_args = list(cmd_args)
+
+    for index, size in decoder.bytes_fields:
+        arg = cmd_args[index]
+
+        if isinstance(arg, str) and len(arg) > size:
+            cmd_args[index] = base64.b64decode(arg)
+
+    return tuple(cmd_args)
+
+
 @contextlib.contextmanager
-def output_file(ast_output):
+def output_file(ast_output, mode="w"):
     """
     Helper context manager that either wraps `open()` or simply yields an `io.BytesIO`.
     Also provides basic type validation.
+    Files are written to a temporary file next to the output, which only replaces the output once
+    it has been written in full. If writing fails the previous output is left untouched.
     """
     if isinstance(ast_output, str):
-        with open(ast_output, "w") as ast_fp:
-            yield ast_fp
+        temp_path = f"{ast_output}.{os.getpid()}.tmp"
+
+        try:
+            with open(temp_path, mode) as ast_fp:
+                yield ast_fp
+
+            os.replace(temp_path, ast_output)
+
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(temp_path)
+
+            raise
 
     elif isinstance(ast_output, io.BytesIO):
         yield ast_output
@@ -190,27 +473,42 @@ def output_file(ast_output):
         raise TypeError(f"Unsupported output type {ast_output}!")
 
 
+@contextlib.contextmanager
+def input_buffer(scr_source, use_mmap=False):
+    """
+    Helper context manager that yields the contents of a script file, either read into memory
+    or memory mapped. Buffers are yielded as-is.
+    """
+    if isinstance(scr_source, (str, os.PathLike)):
+        with open(scr_source, "rb") as scr_fp:
+            if use_mmap:
+                with mmap.mmap(scr_fp.fileno(), 0, access=mmap.ACCESS_READ) as scr_map:
+                    yield scr_map
+
+            else:
+                yield scr_fp.read()
+
+    else:
+        yield scr_source
+
+
 def _parse_header(scr_contents):
     """
     Parse the header of the script. The header contains a function count and a number of
     entries defining those functions. It seems like these entries are declarations of some sort,
     perhaps of functions to be exported by the script?
-    Additionally, the remaining data after each name appears to be a command id? Not sure, it
-    could also be a signature definition. Unsure of what this data is actually for.
+    The remaining data after each name is the offset of the function relative to the start
+    of the script commands.
     """
     functions = []
 
     num_functions = struct.unpack_from("<I", scr_contents)[0]
-    scr_contents = scr_contents[INT_SIZE:]
 
     for func_index in range(num_functions):
-        offset = (func_index * FUNCTION_ENTRY_LEN)
-        entry = scr_contents[offset:offset+FUNCTION_ENTRY_LEN]
+        offset = INT_SIZE + (func_index * FUNCTION_ENTRY_LEN)
+        function_name, function_offset = FUNCTION_ENTRY_STRUCT.unpack_from(scr_contents, offset)
 
-        function_name = bytes_to_str(entry[:FUNCTION_NAME_LEN])
-        function_data = entry[FUNCTION_NAME_LEN:]
-
-        functions.append((function_name, function_data))
+        functions.append((decode_name_arg(function_name), function_offset))
 
     if len(functions) != num_functions:
         raise ValueError("Function count mismatch!")
@@ -221,36 +519,78 @@ def _parse_header(scr_contents):
 def _parse_script(scr_contents, num_functions):
     """
     Parse the script into meaningful commands/symbols.
+    Tokens are offsets into the script data so we never copy the remaining script per command.
     """
-    tokens = []
-
     script_start = INT_SIZE + (FUNCTION_ENTRY_LEN * num_functions)
-    remaining = scr_contents[script_start:]
+    return iter_tokens(scr_contents, script_start)
+
+
+def _unpack_command_args(decoder, scr_contents, offset):
+    """
+    To begin the parsing process unpack our binary data with the precompiled command struct.
+    Arguments declared as names in the command map are decoded as strings, and for commands
+    without declared fields we attempt to decode bytestrings as ASCII if they contain human readable text.
+    """
+    command_args = decoder.struct.unpack_from(scr_contents, offset)
+
+    if not decoder.name_fields and not decoder.string_fields:
+        return command_args
+
+    command_args = list(command_args)
+
+    for i in decoder.name_fields:
+        command_args[i] = decode_name_arg(command_args[i])
+
+    for i in decoder.string_fields:
+        command_args[i] = decode_str_arg(command_args[i])
 
-    while remaining:
-        command_id, command_info, command_args, remaining = get_command(remaining)
-        tokens.append((command_id, command_info, command_args))
+    return tuple(command_args)
 
-    return tokens
 
+@functools.lru_cache(maxsize=None)
+def get_node_decoders():
+    """
+    Get the generated per command decoder functions, building them on first use.
+    Each decoder unpacks the arguments of its command straight into a `ScrNode`.
+    """
+    from .codegen import build_node_decoders
+    return build_node_decoders(ScrNode, decode_name_arg, decode_str_arg, COMMAND_HAS_BODY)
 
-def _unpack_command_args(fmt, command_args):
+
+def _decode_tokens(scr_contents, tokens, lazy=False):
     """
-    To begin the parsing process call `struct.unpack()` on our binary data.
-    We automatically attempt to decode bytestrings as ASCII if they contain human readable text.
+    Decode the script tokens one at a time, yielding each command node along with its nesting depth.
+    Commands that end a body are yielded at the same depth as the command that started it.
+    If `lazy` is set the command arguments are not decoded until they are first read.
     """
-    command_args = list(struct.unpack(fmt, command_args))
+    depth = 0
+    command_table = get_command_table()
+    node_decoders = get_node_decoders()
+
+    for command_id, offset, _ in tokens:
+        if lazy:
+            node = LazyScrNode(command_table[command_id].name, command_id, scr_contents, offset,
+                               command_id in COMMAND_HAS_BODY)
 
-    for i, arg in enumerate(command_args):
-        if isinstance(arg, bytes) and is_ascii_str(arg):
-            command_args[i] = bytes_to_str(arg)
+        else:
+            node = node_decoders[command_id](scr_contents, offset)
+
+        if command_id in COMMAND_BODY_END:
+            # FIXME: parser is sometimes popping out the root node. this is definitely a bug, but
+            #        for now as a stop-gap we never let the depth drop below the root.
+            depth = max(depth - 1, 0)
+            yield depth, node
 
-    return command_args
+        else:
+            yield depth, node
 
+            if node.body is not None:
+                depth += 1
 
-def _parse_tokens(tokens):
+
+def _parse_tokens(commands):
     """
-    Parse the script tokens into an AST so we can later
+    Parse the decoded script commands into an AST so we can later
     attempt to use the script data, or edit said data, in as human-readable a form as possible.
     """
     root_node = AstNode(has_body=True)
@@ -258,49 +598,301 @@ def _parse_tokens(tokens):
     ast_stack = collections.deque()
     ast_stack.append(root_node.body)
 
-    for command_id, command_info, command_args in tokens:
-        fmt = command_info["format"]
-        size = command_info["size"]
+    for depth, node in commands:
+        command_id = node.cmd_id
 
-        if struct.calcsize(fmt) != size:
-            raise ValueError(f"Data size mismatch ({command_id}): {fmt} - {size}")
+        if command_id in COMMAND_BODY_END:
+            continue
 
-        command_args = _unpack_command_args(fmt, command_args)
-        node = ScrNode(command_info["name"], command_id, command_args, has_body=True)
+        while len(ast_stack) > depth + 1:
+            ast_stack.pop()
 
-        if command_id in COMMAND_HAS_BODY:
-            # FIXME: parser is sometimes popping out the root node. this is definitely a bug, but
-            #        for now as a stop-gap we just re-append the root if the stack is empty.
-            if not ast_stack:
-                ast_stack.append(root_node.body)
+        ast_stack[-1].append(node)
 
-            ast_stack[-1].append(node)
+        if node.body is not None:
             ast_stack.append(node.body)
 
-        elif command_id in COMMAND_BODY_END:
-            ast_stack.pop()
+    return root_node
+
+
+def _encode_json_arg(arg):
+    """
+    Helper to encode a single command argument the same way `json.dump` encodes `ScrNode.to_json`.
+    """
+    arg_type = type(arg)
+
+    if arg_type is int:
+        return int.__repr__(arg)
+
+    elif arg_type is str:
+        return encode_json_str(arg)
+
+    elif arg_type is bytes:
+        return encode_json_str(base64.b64encode(arg).decode("UTF-8"))
+
+    return json.dumps(arg)
+
+
+def _iter_json_chunks(commands):
+    """
+    Render the decoded script commands as the JSON document `json.dump(..., indent=4)` would render
+    `root_node.to_json()`, one chunk per command, without ever building the AST.
+    Every open body is a list nested two levels deeper than the list holding its command,
+    so we only need to track how many commands have been written to each open body.
+    """
+    body_counts = [0]
+    node_prefixes = {}
+
+    def close_body():
+        level = len(body_counts) - 1
+        count = body_counts.pop()
+
+        indent = " " * (8 * level)
+        body_end = "\n" + indent + "]" if count else "]"
+
+        return body_end + "\n" + indent[:-4] + "}" if level else body_end
+
+    yield "["
+
+    for depth, node in commands:
+        command_id = node.cmd_id
+
+        if command_id in COMMAND_BODY_END:
+            continue
+
+        chunks = []
+
+        while len(body_counts) > depth + 1:
+            chunks.append(close_body())
+
+        node_prefix = node_prefixes.get((command_id, depth))
+
+        if node_prefix is None:
+            indent = " " * (8 * depth + 4)
+            node_prefix = (f"\n{indent}{{\n{indent}    \"cmd_name\": {encode_json_str(node.cmd_name)},"
+                           f"\n{indent}    \"cmd_id\": {command_id},\n{indent}    \"cmd_args\": ")
+            node_prefixes[command_id, depth] = node_prefix
+
+        if body_counts[-1]:
+            chunks.append(",")
+
+        body_counts[-1] += 1
+        chunks.append(node_prefix)
+
+        indent = " " * (8 * depth + 8)
+        cmd_args = node.cmd_args
+
+        if cmd_args:
+            arg_separator = ",\n" + indent + "    "
+            chunks.append(f"[\n{indent}    {arg_separator.join(map(_encode_json_arg, cmd_args))}\n{indent}],")
 
         else:
-            ast_stack[-1].append(node)
+            chunks.append("[],")
 
-    return root_node
+        if node.body is not None:
+            chunks.append(f"\n{indent}\"body\": [")
+            body_counts.append(0)
+
+        else:
+            chunks.append(f"\n{indent}\"body\": []\n{indent[:-4]}}}")
+
+        yield "".join(chunks)
+
+    while len(body_counts) > 1:
+        yield close_body()
+
+    yield close_body()
+
+
+def _iter_compact_json_chunks(commands):
+    """
+    Render the decoded script commands as compact array form nodes without any whitespace,
+    the same as `json.dump(root_node.to_json(compact=True), separators=(",", ":"))`,
+    one chunk per command.
+    """
+    body_counts = [0]
+
+    yield "["
+
+    for depth, node in commands:
+        command_id = node.cmd_id
+
+        if command_id in COMMAND_BODY_END:
+            continue
+
+        chunks = []
+
+        while len(body_counts) > depth + 1:
+            body_counts.pop()
+            chunks.append("]]")
+
+        if body_counts[-1]:
+            chunks.append(",")
+
+        body_counts[-1] += 1
+        chunks.append(f"[{command_id},[{','.join(map(_encode_json_arg, node.cmd_args))}]")
+
+        if node.body is not None:
+            chunks.append(",[")
+            body_counts.append(0)
+
+        else:
+            chunks.append("]")
+
+        yield "".join(chunks)
+
+    while len(body_counts) > 1:
+        body_counts.pop()
+        yield "]]"
+
+    yield "]"
+
+
+def _check_lazy_mmap(lazy, use_mmap):
+    """
+    Lazy nodes decode from the script data after parsing is finished, by which point
+    a memory mapped script file has already been closed.
+    """
+    if lazy and use_mmap:
+        raise ValueError("Lazy nodes cannot be used with memory mapped script files!")
+
+
+def iter_commands(source, use_mmap=False, lazy=False):
+    """
+    Iterate the commands of a BlazBlue script, decoding each command only once we reach it.
+    The source may be a script file path or any buffer containing the script data.
+    If `use_mmap` is set, script files are memory mapped rather than read into memory.
+    If `lazy` is set, command arguments are not decoded until they are first read.
+    We yield the nesting depth of each command along with its node. The bodies of these nodes
+    are left empty, it is up to the caller to assemble them (see `_parse_tokens`).
+    """
+    _check_lazy_mmap(lazy, use_mmap)
+
+    with input_buffer(source, use_mmap) as scr_contents:
+        functions = _parse_header(scr_contents)
+
+        # Make sure the tokenizer releases its view of the script data before a mapping is closed.
+        with contextlib.closing(_parse_script(scr_contents, len(functions))) as tokens:
+            yield from _decode_tokens(scr_contents, tokens, lazy)
+
+
+def build_index(source, use_mmap=False):
+    """
+    Build a `ScriptIndex` of the functions in a BlazBlue script from the script header alone.
+    The source may be a script file path or any buffer containing the script data.
+    """
+    with input_buffer(source, use_mmap) as scr_contents:
+        return ScriptIndex.from_buffer(scr_contents)
+
+
+def _parse_function_range(scr_contents, function_name, start, end, lazy=False):
+    """
+    Helper to parse the script data of a single function into its function node.
+    """
+    with contextlib.closing(iter_tokens(scr_contents, start, end)) as tokens:
+        root_node = _parse_tokens(_decode_tokens(scr_contents, tokens, lazy))
+
+    if not root_node.body or root_node.body[0].cmd_id not in COMMAND_FUNCTIONS:
+        raise ValueError(f"Function {function_name} does not start with a function definition!")
+
+    return root_node.body[0]
+
+
+def parse_function(source, function_name, use_mmap=False, lazy=False, index=None):
+    """
+    Parse a single function of a BlazBlue script into an AST, without decoding any other functions.
+    An existing `ScriptIndex` for the script may be passed in to avoid re-reading the header.
+    """
+    _check_lazy_mmap(lazy, use_mmap)
+
+    with input_buffer(source, use_mmap) as scr_contents:
+        if index is None:
+            index = ScriptIndex.from_buffer(scr_contents)
 
+        start, end = index.get_range(function_name)
+        return _parse_function_range(scr_contents, function_name, start, end, lazy)
 
-def parse_script(scr_path, ast_output=None):
+
+def byte_view(scr_buffer):
+    """
+    Helper to get a flat view of the bytes of any buffer protocol object, without copying it.
+    Offsets and lengths in the script data are always counted in bytes, whatever the format of the buffer.
+    """
+    scr_view = memoryview(scr_buffer)
+
+    if scr_view.ndim != 1 or scr_view.format != "B":
+        scr_view = scr_view.cast("B")
+
+    return scr_view
+
+
+def parse_buffer(scr_buffer, lazy=False, cache=None):
+    """
+    Parse a BlazBlue script held in memory into an AST, without copying the script data.
+    The buffer may be any buffer protocol object, such as `bytes`, `bytearray`, `memoryview`, or `mmap`.
+    If `lazy` is set, command arguments are not decoded until they are first read, in which case the
+    buffer must stay alive and unchanged until then. If a `DiskCache` or `ScriptCache` is given,
+    scripts that have been parsed before are read from the cache.
+    """
+    if lazy and cache is not None:
+        raise ValueError("Lazy nodes cannot be cached!")
+
+    scr_view = byte_view(scr_buffer)
+
+    if lazy:
+        return _parse_tokens(iter_commands(scr_view, lazy=True))
+
+    # Release our view once we are done, so a memory mapped buffer can be closed straight away.
+    with scr_view:
+        if cache is not None:
+            return cache.parse(scr_view)
+
+        return _parse_tokens(iter_commands(scr_view))
+
+
+def read_json(json_source):
+    """
+    Helper to read a JSON document from a file path or a file object.
+    """
+    if isinstance(json_source, (str, os.PathLike)):
+        with open(json_source, "r") as json_fp:
+            return json.load(json_fp)
+
+    return json.load(json_source)
+
+
+def load_json(json_source):
+    """
+    Load an AST from a JSON document rendered by `parse_script`.
+    The source may be a JSON file path or a file object.
+    """
+    with paused_gc():
+        return AstNode.from_json(read_json(json_source))
+
+
+def get_json_path(scr_path):
+    """
+    Helper to get the default path of the JSON document rendered for a script file.
+    """
+    return os.path.splitext(scr_path)[0] + ".json"
+
+
+def parse_script(scr_path, ast_output=None, use_mmap=False, compact=False, cache=None):
     """
     Parse a BlazBlue script file and render the tokens as a JSON document.
+    If `use_mmap` is set, the script file is memory mapped rather than read into memory.
+    If `compact` is set, nodes are rendered as arrays without any indentation (see `json_node_fields`).
+    If a `DiskCache` or `ScriptCache` is given, scripts that have been parsed before are read from the cache.
 
     Reference: https://github.com/dantarion/bbtools/blob/master/bbcf_bbtag_script_parser.py
     """
-    with open(scr_path, "rb") as scr_fp:
-        scr_contents = scr_fp.read()
-
     if ast_output is None:
-        ast_output = scr_path.replace(".bin", ".json")
+        ast_output = get_json_path(scr_path)
 
-    functions = _parse_header(scr_contents)
-    tokens = _parse_script(scr_contents, len(functions))
-    root_node = _parse_tokens(tokens)
+    if isinstance(ast_output, str) and os.path.abspath(ast_output) == os.path.abspath(scr_path):
+        raise ValueError(f"Output path {ast_output} is the same as the script path!")
 
     with output_file(ast_output) as json_fp:
-        json.dump(root_node.to_json(), json_fp, indent=4)
+        iter_chunks = _iter_compact_json_chunks if compact else _iter_json_chunks
+        commands = cache.iter_commands(scr_path, use_mmap) if cache is not None else iter_commands(scr_path, use_mmap)
+        json_fp.writelines(iter_chunks(commands))
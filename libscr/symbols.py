@@ -1,3 +1,28 @@
+from .const import (
+    MOTION_6,
+    MOTION_236,
+    MOTION_623,
+    MOTION_214,
+    MOTION_41236,
+    MOTION_63214,
+    MOTION_22,
+    MOTION_2HOLD8,
+    MOTION_236236,
+    MOTION_214214,
+    MOTION_632146,
+    SPECIAL_RELEASE_A,
+    SPECIAL_PRESS_A,
+    SPECIAL_RELEASE_B,
+    SPECIAL_PRESS_B,
+    SPECIAL_RELEASE_C,
+    SPECIAL_PRESS_C,
+    SPECIAL_RELEASE_D,
+    SPECIAL_PRESS_D,
+    MOVE_TYPE_SPECIAL,
+    MOVE_TYPE_DISTORTION,
+    MOVE_TYPE_ASTRAL,
+)
+
 INPUT_1A = 256
 INPUT_1B = 512
 INPUT_1C = 768
@@ -71,32 +96,6 @@ INPUT_J9B = 529
 INPUT_J9C = 785
 INPUT_J9D = 1041
 
-MOTION_6 = 120
-MOTION_236 = 172
-MOTION_623 = 173
-MOTION_214 = 174
-MOTION_41236 = 175
-MOTION_63214 = 177
-MOTION_22 = 186
-MOTION_2HOLD8 = 189
-MOTION_236236 = 178
-MOTION_214214 = 179
-MOTION_632146 = 249
-
-SPECIAL_RELEASE_A = 3
-SPECIAL_PRESS_A = 4
-SPECIAL_RELEASE_B = 12
-SPECIAL_PRESS_B = 13
-SPECIAL_RELEASE_C = 21
-SPECIAL_PRESS_C = 22
-SPECIAL_RELEASE_D = 30
-SPECIAL_PRESS_D = 31
-
-MOVE_TYPE_SPECIAL = 2
-MOVE_TYPE_DISTORTION = 1542
-MOVE_TYPE_ASTRAL = 1543
-
-
 async def yield_control():
     pass
 
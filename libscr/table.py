@@ -0,0 +1,284 @@
+import re
+import array
+import functools
+import itertools
+import contextlib
+import collections
+
+from .commands import *
+from .scr import COMMAND_HAS_BODY, COMMAND_BODY_END, input_buffer, _parse_header, _parse_script
+
+FORMAT_FIELD_PATTERN = re.compile(r"(\d*)([a-zA-Z?])")
+
+NUMPY_FIELD_TYPES = {
+
+    "b": "i1",
+    "B": "u1",
+    "h": "<i2",
+    "H": "<u2",
+    "i": "<i4",
+    "I": "<u4",
+    "q": "<i8",
+    "Q": "<u8",
+    "f": "<f4",
+    "d": "<f8",
+}
+
+CommandColumns = collections.namedtuple("CommandColumns", ("indices", "columns"))
+
+
+@functools.lru_cache(maxsize=None)
+def _get_numpy():
+    """
+    NumPy is optional and slow to import, so we only try to import it once it is first needed.
+    """
+    try:
+        import numpy
+
+    except ImportError:
+        return None
+
+    return numpy
+
+
+class TokenTable:
+    """
+    A flat, columnar representation of the script tokens. Rather than a tree of `ScrNode` objects
+    we keep parallel arrays of the command ID, argument offset, nesting depth, and index of the
+    enclosing command (-1 for the root) of every token. Commands that end a body share the
+    depth and parent of the command that started it.
+    """
+    def __init__(self):
+        self.command_id = array.array("I")
+        self.offset = array.array("I")
+        self.depth = array.array("H")
+        self.parent_index = array.array("i")
+
+    @classmethod
+    def from_tokens(cls, tokens):
+        """
+        Build a token table straight from the tokenizer, without decoding any commands.
+        """
+        table = cls()
+
+        append_command_id = table.command_id.append
+        append_offset = table.offset.append
+        append_depth = table.depth.append
+        append_parent_index = table.parent_index.append
+
+        parent_stack = [-1]
+
+        for index, (command_id, offset, _) in enumerate(tokens):
+            # Never pop the root, see the FIXME in `_decode_tokens`.
+            if command_id in COMMAND_BODY_END and len(parent_stack) > 1:
+                parent_stack.pop()
+
+            append_command_id(command_id)
+            append_offset(offset)
+            append_depth(len(parent_stack) - 1)
+            append_parent_index(parent_stack[-1])
+
+            if command_id in COMMAND_HAS_BODY:
+                parent_stack.append(index)
+
+        return table
+
+    def __len__(self):
+        return len(self.command_id)
+
+    @property
+    def nbytes(self):
+        """
+        The number of bytes used by the columns of the table.
+        """
+        columns = (self.command_id, self.offset, self.depth, self.parent_index)
+        return sum(column.itemsize * len(column) for column in columns)
+
+    def find(self, command_id):
+        """
+        Get the indices of every token with the given command ID.
+        """
+        numpy = _get_numpy()
+
+        if numpy is not None:
+            return numpy.nonzero(self.to_numpy()["command_id"] == command_id)[0]
+
+        return [index for index, value in enumerate(self.command_id) if value == command_id]
+
+    def offsets_of(self, command_id):
+        """
+        Get the argument offsets of every token with the given command ID.
+        """
+        if _get_numpy() is not None:
+            return self.to_numpy()["offset"][self.find(command_id)]
+
+        return [self.offset[index] for index in self.find(command_id)]
+
+    def to_numpy(self):
+        """
+        Get NumPy views of the columns of the table. The views share memory with the table.
+        """
+        numpy = _get_numpy()
+
+        if numpy is None:
+            raise RuntimeError("NumPy is required for NumPy token tables!")
+
+        columns = {
+
+            "command_id": self.command_id,
+            "offset": self.offset,
+            "depth": self.depth,
+            "parent_index": self.parent_index,
+        }
+
+        return {name: numpy.frombuffer(column, dtype=column.typecode) for name, column in columns.items()}
+
+
+def build_token_table(source, use_mmap=False):
+    """
+    Build a `TokenTable` for a BlazBlue script without decoding any commands.
+    The source may be a script file path or any buffer containing the script data.
+    """
+    with input_buffer(source, use_mmap) as scr_contents:
+        functions = _parse_header(scr_contents)
+
+        with contextlib.closing(_parse_script(scr_contents, len(functions))) as tokens:
+            return TokenTable.from_tokens(tokens)
+
+
+def _format_fields(command_struct):
+    """
+    Expand a command struct format into a list of (type code, byte count) per field.
+    The byte count is only meaningful for bytestring fields.
+    """
+    fields = []
+
+    for count, code in FORMAT_FIELD_PATTERN.findall(command_struct.format):
+        count = int(count) if count else 1
+
+        if code == "s":
+            fields.append((code, count))
+
+        else:
+            fields.extend([(code, 0)] * count)
+
+    return fields
+
+
+def _group_by_format(command_indices):
+    """
+    Group the command IDs of the table by command format.
+    """
+    command_table = get_command_table()
+    format_groups = collections.defaultdict(list)
+
+    for command_id in command_indices:
+        format_groups[command_table[command_id].struct.format].append(command_id)
+
+    return format_groups
+
+
+def _split_columns(command_indices, command_ids, group_columns):
+    """
+    Split the columns of a decoded format group back up into columns for each command.
+    """
+    command_columns = {}
+    start = 0
+
+    for command_id in command_ids:
+        indices = command_indices[command_id]
+        end = start + len(indices)
+
+        columns = tuple(column[start:end] for column in group_columns)
+        command_columns[command_id] = CommandColumns(indices, columns)
+
+        start = end
+
+    return command_columns
+
+
+def _decode_columns_numpy(table, scr_contents):
+    """
+    Decode the tokens of each format group in one step by gathering their bytes into
+    a structured NumPy array. Each field of the format becomes one column.
+    Bytestring fields are read as raw void fields, as NumPy strips trailing NULL characters
+    from `S` fields, and are converted to a tuple of bytestrings like `_decode_columns_struct`.
+    """
+    numpy = _get_numpy()
+    command_table = get_command_table()
+
+    table_columns = table.to_numpy()
+    command_columns = {}
+
+    # Group the token indices by command ID with a stable sort, so they stay in script order.
+    order = numpy.argsort(table_columns["command_id"], kind="stable")
+    unique_ids, starts = numpy.unique(table_columns["command_id"][order], return_index=True)
+    command_indices = dict(zip(unique_ids.tolist(), numpy.split(order, starts[1:])))
+
+    scr_bytes = numpy.frombuffer(scr_contents, dtype=numpy.uint8)
+
+    for command_ids in _group_by_format(command_indices).values():
+        command_struct = command_table[command_ids[0]].struct
+        group_columns = []
+
+        if command_struct.size > 0:
+            fields = _format_fields(command_struct)
+            dtype = numpy.dtype([(f"f{index}", f"V{count}" if code == "s" else NUMPY_FIELD_TYPES[code])
+                                 for index, (code, count) in enumerate(fields)])
+
+            group_indices = numpy.concatenate([command_indices[command_id] for command_id in command_ids])
+            offsets = table_columns["offset"][group_indices].astype(numpy.int64)
+
+            gathered = scr_bytes[offsets[:, None] + numpy.arange(command_struct.size)]
+            records = gathered.view(dtype).reshape(len(offsets))
+
+            group_columns = [tuple(records[name].tolist()) if code == "s" else records[name]
+                             for name, (code, _) in zip(dtype.names, fields)]
+
+        command_columns.update(_split_columns(command_indices, command_ids, group_columns))
+
+    return command_columns
+
+
+def _decode_columns_struct(table, scr_contents):
+    """
+    Decode the tokens of each format group with one `map()` of the precompiled struct over
+    their offsets, so the per token loop stays in C. Each field of the format becomes one column.
+    """
+    command_table = get_command_table()
+
+    command_columns = {}
+    command_indices = collections.defaultdict(list)
+
+    for index, command_id in enumerate(table.command_id):
+        command_indices[command_id].append(index)
+
+    for command_ids in _group_by_format(command_indices).values():
+        command_struct = command_table[command_ids[0]].struct
+        group_columns = []
+
+        if command_struct.size > 0:
+            group_indices = itertools.chain.from_iterable(command_indices[command_id] for command_id in command_ids)
+            offsets = map(table.offset.__getitem__, group_indices)
+
+            rows = map(command_struct.unpack_from, itertools.repeat(scr_contents), offsets)
+            group_columns = list(zip(*rows))
+
+        command_columns.update(_split_columns(command_indices, command_ids, group_columns))
+
+    return command_columns
+
+
+def decode_columns(table, scr_contents):
+    """
+    Decode the arguments of every token in a `TokenTable` in bulk. Tokens are grouped by
+    command format and each group is decoded in one step, using NumPy if it is available.
+    We return a `CommandColumns` per command ID, holding the token indices of that command
+    and one column per argument. Bytestring arguments are left as raw bytes, NULL padding included.
+    With NumPy the indices and numeric columns are NumPy arrays, otherwise they are a list and tuples.
+    Bytestring columns are always tuples of bytestrings.
+    """
+    if _get_numpy() is not None:
+        return _decode_columns_numpy(table, scr_contents)
+
+    return _decode_columns_struct(table, scr_contents)
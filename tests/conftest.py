@@ -0,0 +1,49 @@
+import pytest
+
+from libscr.commands import *
+from libscr.scr import COMMAND_HAS_BODY, AstNode, ScrNode
+from libscr.builder import build_script
+
+
+def make_node(command_id, *cmd_args):
+    decoder = get_command_decoder(command_id)
+    return ScrNode(decoder.name, command_id, cmd_args, command_id in COMMAND_HAS_BODY)
+
+
+def make_ast():
+    """
+    Build a small synthetic AST covering nested bodies, declared names, undeclared bytestrings
+    that are and are not readable text, and more than one function.
+    """
+    root_node = AstNode(has_body=True)
+
+    state = make_node(CMD_START_STATE, "State0")
+    state.body.append(make_node(CMD_SPRITE, "spr000_00", 4))
+
+    if_node = make_node(CMD_IF, 2, 1)
+    if_node.body.append(make_node(CMD_SPRITE, "spr000_01", 6))
+    if_node.body.append(make_node(22, "note"))
+    state.body.append(if_node)
+
+    state.body.append(make_node(22, b"\x01\xff" + bytes(30)))
+    state.body.append(make_node(CMD_YIELD_CONTROL))
+
+    subroutine = make_node(CMD_START_SUBROUTINE, "Sub0")
+    subroutine.body.append(make_node(CMD_SPRITE, "spr001_00", 2))
+
+    root_node.body.extend((state, subroutine))
+
+    return root_node
+
+
+@pytest.fixture
+def scr_data():
+    return bytes(build_script(make_ast()))
+
+
+@pytest.fixture
+def scr_path(tmp_path, scr_data):
+    scr_path = tmp_path / "synthetic.bin"
+    scr_path.write_bytes(scr_data)
+
+    return str(scr_path)
@@ -0,0 +1,48 @@
+import io
+
+import pytest
+
+from libscr import AstFile, dump_ast, load_ast, open_ast_file, parse_buffer
+from libscr.scr import COMMAND_BODY_END, iter_commands
+from libscr.astfile import dump_commands
+
+from conftest import make_ast
+
+
+def test_ast_file_round_trip(scr_data):
+    ast_data = dump_ast(parse_buffer(scr_data))
+
+    assert load_ast(ast_data).to_json() == make_ast().to_json()
+    assert load_ast(ast_data, lazy=True).to_json() == make_ast().to_json()
+
+
+def test_dump_commands_matches_dump_ast(scr_data):
+    assert dump_commands(iter_commands(scr_data)) == dump_ast(make_ast())
+
+
+def test_ast_file_output(scr_data):
+    ast_output = io.BytesIO()
+    ast_data = dump_ast(make_ast(), ast_output)
+
+    assert ast_output.getvalue() == ast_data
+
+
+def test_open_ast_file(tmp_path, scr_data):
+    ast_path = str(tmp_path / "synthetic.scra")
+    dump_ast(make_ast(), ast_path)
+
+    with open_ast_file(ast_path) as ast_file:
+        function_indices = list(ast_file.iter_children())
+
+        assert [ast_file.get_args(index) for index in function_indices] == [("State0",), ("Sub0",)]
+        assert ast_file.get_node(function_indices[1]).to_json() == make_ast().body[1].to_json()
+
+        script_nodes = [(depth, node.cmd_id) for depth, node in iter_commands(scr_data)
+                        if node.cmd_id not in COMMAND_BODY_END]
+
+        assert [(depth, node.cmd_id) for depth, node in ast_file.iter_nodes()] == script_nodes
+
+
+def test_ast_file_rejects_other_data(scr_data):
+    with pytest.raises(ValueError):
+        AstFile(scr_data)
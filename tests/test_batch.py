@@ -0,0 +1,53 @@
+import os
+import argparse
+
+import pytest
+
+from libscr.__main__ import expand_scr_paths, parse_scripts
+
+
+@pytest.fixture
+def scr_dir(tmp_path, scr_data):
+    (tmp_path / "a.bin").write_bytes(scr_data)
+    (tmp_path / "b.json").write_text("[]")
+    (tmp_path / "c.bin").mkdir()
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "d.bin").write_bytes(scr_data)
+
+    return tmp_path
+
+
+def expand(scr_dir, *values):
+    scr_paths = expand_scr_paths(argparse.ArgumentParser(), [str(scr_dir / value) for value in values])
+    return sorted(os.path.relpath(scr_path, scr_dir) for scr_path in scr_paths)
+
+
+def test_globs_only_match_script_files(scr_dir):
+    assert expand(scr_dir, "*") == ["a.bin"]
+    assert expand(scr_dir, "**") == ["a.bin", os.path.join("sub", "d.bin")]
+
+
+def test_directories_are_searched(scr_dir):
+    assert expand(scr_dir, ".") == ["a.bin", os.path.join("sub", "d.bin")]
+
+
+def test_scripts_are_listed_once(scr_dir):
+    assert expand(scr_dir, "a.bin", "*.bin", ".") == ["a.bin", os.path.join("sub", "d.bin")]
+
+
+def test_missing_paths_are_rejected(scr_dir):
+    with pytest.raises(SystemExit):
+        expand(scr_dir, "missing.bin")
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_failures_are_collected(scr_dir, jobs):
+    bad_path = scr_dir / "bad.bin"
+    bad_path.write_bytes(b"\x01\x00\x00\x00")
+
+    scr_paths = [str(scr_dir / "a.bin"), str(bad_path), str(scr_dir / "sub" / "d.bin")]
+
+    assert parse_scripts(scr_paths, jobs) == [str(bad_path)]
+    assert (scr_dir / "a.json").exists()
+    assert (scr_dir / "sub" / "d.json").exists()
+    assert not (scr_dir / "bad.json").exists()
@@ -0,0 +1,48 @@
+from libscr import build_script, build_script_from_json, load_json, parse_buffer, parse_script
+from libscr.commands import CMD_SPRITE, CMD_START_STATE
+from libscr.scr import AstNode
+
+from conftest import make_ast, make_node
+
+
+def test_ast_round_trip(scr_data):
+    root_node = parse_buffer(scr_data)
+
+    assert root_node.to_json() == make_ast().to_json()
+    assert bytes(build_script(root_node)) == scr_data
+
+
+def test_lazy_ast_round_trip(scr_data):
+    assert bytes(build_script(parse_buffer(scr_data, lazy=True))) == scr_data
+
+
+def test_json_round_trip(tmp_path, scr_path, scr_data):
+    json_path = str(tmp_path / "synthetic.json")
+    parse_script(scr_path, json_path)
+
+    assert load_json(json_path).to_json() == make_ast().to_json()
+    assert bytes(build_script_from_json(json_path)) == scr_data
+
+
+def test_compact_json_round_trip(tmp_path, scr_path, scr_data):
+    json_path = str(tmp_path / "synthetic.json")
+    parse_script(scr_path, json_path, compact=True)
+
+    assert load_json(json_path).to_json() == make_ast().to_json()
+    assert bytes(build_script_from_json(json_path)) == scr_data
+
+
+def test_padding_round_trip():
+    root_node = AstNode(has_body=True)
+
+    state = make_node(CMD_START_STATE, b"State0\x00junk" + bytes(21))
+    state.body.append(make_node(CMD_SPRITE, b"spr000_00\x00\x01" + bytes(21), 4))
+    state.body.append(make_node(22, b"\x00note" + bytes(27)))
+    state.body.append(make_node(22, b"note\x00x" + bytes(26)))
+    root_node.body.append(state)
+
+    scr_data = bytes(build_script(root_node))
+    parsed_node = parse_buffer(scr_data)
+
+    assert parsed_node.to_json() == root_node.to_json()
+    assert bytes(build_script(parsed_node)) == scr_data
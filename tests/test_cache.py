@@ -0,0 +1,131 @@
+import os
+
+from libscr import build_script, iter_commands, parse_buffer
+from libscr.scr import COMMAND_BODY_END
+from libscr.cache import AST_CACHE_EXT, NODE_SIZE_ESTIMATE, DiskCache, ScriptCache
+
+from conftest import make_ast
+
+
+def get_entries(cache_dir):
+    return sorted(entry for entry in os.listdir(cache_dir) if entry.endswith(AST_CACHE_EXT))
+
+
+def get_json(commands):
+    """
+    Render the commands yielded by `iter_commands`, leaving out the body end commands AST files do not store.
+    """
+    return [(depth, node.to_json()) for depth, node in commands if node.cmd_id not in COMMAND_BODY_END]
+
+
+def test_disk_cache_stores_and_reads_entries(tmp_path, scr_data):
+    cache = DiskCache(str(tmp_path))
+    expected = parse_buffer(scr_data).to_json()
+
+    assert cache.parse(scr_data).to_json() == expected
+    assert get_entries(tmp_path) == [f"{cache.get_key(scr_data)}{AST_CACHE_EXT}"]
+
+    assert cache.parse(scr_data).to_json() == expected
+    assert get_json(cache.iter_commands(scr_data)) == get_json(iter_commands(scr_data))
+
+
+def test_disk_cache_reads_script_files(tmp_path, scr_path, scr_data):
+    cache = DiskCache(str(tmp_path / "cache"))
+
+    assert cache.parse(scr_path, use_mmap=True).to_json() == parse_buffer(scr_data).to_json()
+    assert cache.parse(scr_data).to_json() == parse_buffer(scr_data).to_json()
+    assert len(get_entries(tmp_path / "cache")) == 1
+
+
+def test_disk_cache_replaces_broken_entries(tmp_path, scr_data):
+    cache = DiskCache(str(tmp_path))
+    cache_path = cache.get_path(cache.get_key(scr_data))
+
+    for entry_data in (b"", b"SCRA\x01", b"not an AST file at all, not even close"):
+        with open(cache_path, "wb") as cache_fp:
+            cache_fp.write(entry_data)
+
+        assert cache.parse(scr_data).to_json() == parse_buffer(scr_data).to_json()
+
+        with open(cache_path, "rb") as cache_fp:
+            assert cache_fp.read(4) == b"SCRA"
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path, scr_data):
+    cache = DiskCache(str(tmp_path))
+    root_node = make_ast()
+    root_node.body.pop()
+    other_data = bytes(build_script(root_node))
+
+    cache.parse(scr_data)
+    entry_size = os.path.getsize(cache.get_path(cache.get_key(scr_data)))
+
+    cache.max_size = entry_size
+    os.utime(cache.get_path(cache.get_key(scr_data)), (0, 0))
+    cache.parse(other_data)
+
+    assert get_entries(tmp_path) == [f"{cache.get_key(other_data)}{AST_CACHE_EXT}"]
+
+
+def test_disk_cache_ignores_unwritable_directories(tmp_path, scr_data):
+    (tmp_path / "file").write_bytes(b"")
+    cache = DiskCache(str(tmp_path / "file" / "cache"))
+
+    assert cache.parse(scr_data).to_json() == parse_buffer(scr_data).to_json()
+
+
+def test_script_cache_shares_asts(scr_data):
+    cache = ScriptCache()
+    root_node = cache.parse(scr_data)
+
+    assert root_node.to_json() == parse_buffer(scr_data).to_json()
+    assert cache.parse(bytearray(scr_data)) is root_node
+    assert len(cache) == 1
+
+
+def test_script_cache_notices_changed_files(scr_path):
+    cache = ScriptCache()
+    root_node = cache.parse(scr_path)
+
+    assert cache.parse(scr_path) is root_node
+
+    other_node = make_ast()
+    other_node.body.pop()
+
+    with open(scr_path, "wb") as scr_fp:
+        scr_fp.write(build_script(other_node))
+
+    assert cache.parse(scr_path).to_json() == other_node.to_json()
+
+
+def test_script_cache_evicts_least_recently_used(scr_data):
+    other_node = make_ast()
+    other_node.body.pop()
+    other_data = bytes(build_script(other_node))
+
+    cache = ScriptCache()
+    root_node = cache.parse(scr_data)
+    cache.max_size = cache.size + (cache.size // 2)
+
+    cache.parse(other_data)
+    assert cache.size <= cache.max_size
+    assert len(cache) == 1
+
+    assert cache.parse(scr_data) is not root_node
+
+
+def test_script_cache_skips_large_asts(scr_data):
+    cache = ScriptCache(NODE_SIZE_ESTIMATE)
+    cache.parse(scr_data)
+
+    assert len(cache) == 0
+    assert cache.size == 0
+
+
+def test_script_cache_iter_commands(scr_data):
+    cache = ScriptCache()
+    commands = [(depth, node.cmd_id) for depth, node in cache.iter_commands(scr_data)]
+
+    assert commands == [(depth, node.cmd_id) for depth, node in iter_commands(scr_data)
+                        if node.cmd_id not in COMMAND_BODY_END]
+    assert len(cache) == 1
@@ -0,0 +1,45 @@
+from libscr import ScriptEditor, build_script, parse_function
+from libscr.commands import CMD_SPRITE
+
+from conftest import make_ast, make_node
+
+
+def test_unmodified_editor_rebuilds_script(scr_data):
+    assert bytes(ScriptEditor(scr_data).build()) == scr_data
+
+
+def test_editor_splices_functions(scr_data):
+    root_node = make_ast()
+    root_node.body[0].body.append(make_node(CMD_SPRITE, "spr000_02", 8))
+
+    editor = ScriptEditor(scr_data)
+    editor.set_function(root_node.body[0])
+
+    assert editor.modified == ["State0"]
+    assert editor.get_function("State0").to_json() == root_node.body[0].to_json()
+    assert bytes(editor.build()) == bytes(build_script(root_node))
+
+
+def test_editor_shrinks_functions(scr_data):
+    root_node = make_ast()
+    del root_node.body[0].body[1:]
+
+    editor = ScriptEditor(scr_data)
+    editor.set_function(root_node.body[0])
+
+    assert bytes(editor.build()) == bytes(build_script(root_node))
+
+
+def test_header_names_with_garbage():
+    root_node = make_ast()
+    root_node.body[0].cmd_args = (b"State0\x00junk" + bytes(21),)
+    scr_data = bytes(build_script(root_node))
+
+    assert parse_function(scr_data, "State0").to_json() == root_node.body[0].to_json()
+
+    root_node.body[0].body.append(make_node(CMD_SPRITE, "spr000_02", 8))
+
+    editor = ScriptEditor(scr_data)
+    editor.set_function(root_node.body[0])
+
+    assert bytes(editor.build()) == bytes(build_script(root_node))
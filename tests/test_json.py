@@ -0,0 +1,48 @@
+import json
+
+import pytest
+
+from libscr import build_script, iter_commands, parse_buffer
+from libscr.commands import CMD_IF, CMD_START_STATE, CMD_START_SUBROUTINE, CMD_YIELD_CONTROL
+from libscr.scr import AstNode, _iter_compact_json_chunks, _iter_json_chunks
+
+from conftest import make_ast, make_node
+
+
+def make_empty_bodies_ast():
+    """
+    Build an AST with empty function bodies, an empty nested body, and commands without arguments.
+    """
+    root_node = AstNode(has_body=True)
+
+    state = make_node(CMD_START_STATE, "State0")
+    state.body.append(make_node(CMD_IF, 2, 1))
+    state.body.append(make_node(CMD_YIELD_CONTROL))
+
+    root_node.body.append(state)
+    root_node.body.append(make_node(CMD_START_SUBROUTINE, "Sub0"))
+    root_node.body.append(make_node(CMD_START_STATE, "State1"))
+
+    return root_node
+
+
+AST_CASES = {
+    "empty_script": lambda: AstNode(has_body=True),
+    "empty_bodies": make_empty_bodies_ast,
+    "synthetic": make_ast,
+}
+
+
+@pytest.fixture(params=list(AST_CASES))
+def case_data(request):
+    return bytes(build_script(AST_CASES[request.param]()))
+
+
+def test_json_chunks_match_json_dump(case_data):
+    expected = json.dumps(parse_buffer(case_data).to_json(), indent=4)
+    assert "".join(_iter_json_chunks(iter_commands(case_data))) == expected
+
+
+def test_compact_json_chunks_match_json_dump(case_data):
+    expected = json.dumps(parse_buffer(case_data).to_json(compact=True), separators=(",", ":"))
+    assert "".join(_iter_compact_json_chunks(iter_commands(case_data))) == expected
@@ -0,0 +1,102 @@
+import os
+import argparse
+
+import pytest
+
+import libscr.__main__ as cli
+from libscr import build_script
+from libscr.manifest import MANIFEST_NAME, ConversionManifest
+
+from conftest import make_ast
+
+
+@pytest.fixture
+def scr_dir(tmp_path, scr_data):
+    (tmp_path / "a.bin").write_bytes(scr_data)
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "b.bin").write_bytes(scr_data)
+
+    return tmp_path
+
+
+@pytest.fixture
+def converted(monkeypatch):
+    """
+    Record the scripts converted by each run.
+    """
+    converted = []
+    parse_script = cli.parse_script
+
+    def record_parse_script(scr_path, *args, **kwargs):
+        converted.append(scr_path)
+        return parse_script(scr_path, *args, **kwargs)
+
+    monkeypatch.setattr(cli, "parse_script", record_parse_script)
+
+    return converted
+
+
+def convert(scr_dir, converted, compact=False):
+    """
+    Run an incremental conversion, returning the scripts that were converted and the scripts that failed.
+    """
+    converted.clear()
+    failures = cli.convert_incremental(argparse.ArgumentParser(), str(scr_dir), 1, compact=compact)
+
+    return sorted(os.path.relpath(scr_path, scr_dir) for scr_path in converted), \
+        [os.path.relpath(scr_path, scr_dir) for scr_path in failures]
+
+
+def test_unchanged_scripts_are_skipped(scr_dir, converted):
+    assert convert(scr_dir, converted) == (["a.bin", os.path.join("sub", "b.bin")], [])
+    assert (scr_dir / "a.json").exists()
+    assert (scr_dir / MANIFEST_NAME).exists()
+
+    assert convert(scr_dir, converted) == ([], [])
+
+
+def test_changed_scripts_are_converted(scr_dir, converted):
+    convert(scr_dir, converted)
+
+    root_node = make_ast()
+    root_node.body.pop()
+    (scr_dir / "a.bin").write_bytes(bytes(build_script(root_node)))
+
+    assert convert(scr_dir, converted) == (["a.bin"], [])
+
+
+def test_missing_json_is_converted(scr_dir, converted):
+    convert(scr_dir, converted)
+    (scr_dir / "a.json").unlink()
+
+    assert convert(scr_dir, converted) == (["a.bin"], [])
+    assert (scr_dir / "a.json").exists()
+
+
+def test_removed_scripts_are_forgotten(scr_dir, converted):
+    convert(scr_dir, converted)
+    (scr_dir / "a.bin").unlink()
+
+    assert convert(scr_dir, converted) == ([], [])
+    assert not (scr_dir / "a.json").exists()
+
+    manifest = ConversionManifest.load(str(scr_dir), {"compact": False})
+    assert list(manifest.entries) == [os.path.join("sub", "b.bin")]
+
+
+def test_failed_then_reverted_scripts_are_converted(scr_dir, converted, scr_data):
+    convert(scr_dir, converted)
+
+    (scr_dir / "a.bin").write_bytes(b"\x01\x00\x00\x00")
+    assert convert(scr_dir, converted) == (["a.bin"], ["a.bin"])
+
+    (scr_dir / "a.bin").write_bytes(scr_data)
+    assert convert(scr_dir, converted) == (["a.bin"], [])
+    assert convert(scr_dir, converted) == ([], [])
+
+
+def test_option_change_converts_everything(scr_dir, converted):
+    convert(scr_dir, converted)
+
+    assert convert(scr_dir, converted, compact=True) == (["a.bin", os.path.join("sub", "b.bin")], [])
+    assert convert(scr_dir, converted, compact=True) == ([], [])